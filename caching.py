@@ -0,0 +1,154 @@
+"""
+Result caches shared by main.py and youtube_transcript.py.
+
+LRUCache keeps recent results in memory for a limited time; SQLiteCache keeps
+them on disk across restarts, optionally tied to validators (ETag/Last-Modified)
+that must still match for an entry to be reused. Keys and values are stored as
+JSON, so both caches take tuples of plain values as keys.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Small thread-safe LRU cache with an optional time-to-live.
+
+    Used to remember converted documents, image captions, transcripts and video
+    metadata so repeat requests skip the download, conversion and inference work.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """Create a cache holding at most maxsize entries, each valid for ttl seconds (None for no expiry)."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store value under key, evicting the least recently used entries when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+
+class SQLiteCache:
+    """On-disk LRU cache of JSON values in a SQLite database.
+
+    An entry is reused only while it is younger than the ttl given to get and,
+    when it was stored with validators, while the caller still sees the same
+    validators. Storage errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, path: str, maxsize: int):
+        """Create a cache stored in the SQLite database at path, keeping at most maxsize entries."""
+        self.path = path
+        self.maxsize = maxsize
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (creating if needed) the database; the caller must hold the lock."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, validators TEXT, value TEXT, stored REAL, accessed REAL)"
+                )
+        return self._conn
+
+    def get(self, key, ttl: Optional[float] = None, validators: Optional[Sequence] = None):
+        """Return the value stored under key, or None if missing, older than ttl or stored with other validators."""
+        if self.maxsize <= 0:
+            return None
+        db_key = json.dumps(key)
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT validators, value, stored FROM entries WHERE key = ?", (db_key,)
+                ).fetchone()
+                now = time.time()
+                if (row is None or row[0] != json.dumps(validators)
+                        or (ttl is not None and now - row[2] > ttl)):
+                    return None
+                with conn:
+                    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, db_key))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read cache {self.path}: {e}")
+            return None
+        return json.loads(row[1])
+
+    def set(self, key, value, validators: Optional[Sequence] = None) -> None:
+        """Store a JSON-serializable value under key, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                        (json.dumps(key), json.dumps(validators), json.dumps(value), now, now)
+                    )
+                    conn.execute(
+                        "DELETE FROM entries WHERE key NOT IN "
+                        "(SELECT key FROM entries ORDER BY accessed DESC LIMIT ?)",
+                        (self.maxsize,)
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write cache {self.path}: {e}")
+
+    def delete(self, key, prefix: bool = False) -> None:
+        """Remove the entry stored under key or, with prefix, every entry whose key tuple starts with key's items."""
+        if self.maxsize <= 0:
+            return
+        db_key = json.dumps(list(key) if prefix else key)
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    if prefix:
+                        # Keys are JSON arrays, so a longer key continues the prefix's items after a comma
+                        db_key = db_key[:-1] + ','
+                        conn.execute(
+                            "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(db_key), db_key)
+                        )
+                    else:
+                        conn.execute("DELETE FROM entries WHERE key = ?", (db_key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not clear cache {self.path}: {e}")
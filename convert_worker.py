@@ -0,0 +1,29 @@
+"""
+Document conversion for worker processes.
+
+main.py hands CPU-heavy conversions to a ProcessPoolExecutor when
+MARKITDOWN_CONVERT_PROCESSES is set. Workers import this module instead of
+main, so they skip main's start-up work (the Ollama probe, the MCP server,
+the executors and the log file handler) and only load markitdown.
+"""
+
+# MarkItDown converter shared by every conversion in this worker process
+_CONVERTER = None
+
+
+def convert_file(path: str, file_extension: str) -> str:
+    """Convert the document at path to markdown text.
+
+    Args:
+        path: Path of a file holding the document body
+        file_extension: Extension (e.g. '.pdf') used to pick the converter
+
+    Returns:
+        The converted markdown text
+    """
+    global _CONVERTER
+    if _CONVERTER is None:
+        from markitdown import MarkItDown
+        _CONVERTER = MarkItDown(enable_plugins=True)
+    with open(path, 'rb') as f:
+        return _CONVERTER.convert_stream(f, file_extension=file_extension).text_content
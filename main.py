@@ -31,69 +31,199 @@ Usage:
 """
 
 import os
+import shutil
 import tempfile
 import requests
 import re
-import yt_dlp
 import urllib.parse
 import subprocess
 import json
-import base64
 import sys
 import logging
 import contextlib
 import io
+import hashlib
+import ipaddress
+import mimetypes
+import multiprocessing
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
-from markitdown import MarkItDown
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from fastmcp import FastMCP
-from PIL import Image
-import io
+
+# Conversion entry point for worker processes; a module with no import-time side effects
+from caching import LRUCache, SQLiteCache
+from convert_worker import convert_file
 
 # Import custom YouTube transcript module
 from youtube_transcript import get_youtube_transcript, extract_video_id, get_youtube_video_info
 
-# Setup logging to file instead of stdout when running as MCP server
-# This prevents print statements from interfering with stdio transport
 # When in test mode, log to console; otherwise log only to file
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("markitdown.log"),
-        logging.StreamHandler() if "--test" in sys.argv else logging.NullHandler()
-    ]
-)
+TEST_MODE = "--test" in sys.argv
 logger = logging.getLogger("markitdown")
 
+
+def configure_logging():
+    """Set up logging to file instead of stdout when running as MCP server.
+
+    This prevents print statements from interfering with stdio transport. Called
+    from main(), so importing this module (as conversion worker processes do)
+    opens no log file.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("markitdown.log"),
+            logging.StreamHandler() if TEST_MODE else logging.NullHandler()
+        ]
+    )
+
 # Global variables for Ollama availability
 OLLAMA_AVAILABLE = False
 PREFERRED_MODEL = None
+# Ollama client shared by the availability check and every caption request (see get_ollama_client)
+OLLAMA_CLIENT = None
+# Single worker so concurrent requests queue for the model instead of contending for the GPU
+OLLAMA_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+# gemma3 encodes images at 896x896, so anything larger is downscaled before it is sent
+CAPTION_MAX_SIDE = 896
+# Generation settings for captions: bounded output, a context just big enough for one image,
+# and a low temperature for factual descriptions
+CAPTION_OPTIONS = {'num_predict': 256, 'num_ctx': 2048, 'temperature': 0.2}
+# How long Ollama keeps the vision model loaded after a caption request
+CAPTION_KEEP_ALIVE = os.getenv('OLLAMA_KEEP_ALIVE', '10m')
 
 # Use this for output instead of print() to avoid interfering with MCP stdio transport
 def log_info(message):
-    if "--test" in sys.argv:
+    if TEST_MODE:
         print(message)  # Print to console in test mode
     else:
         logger.info(message)  # Log to file in MCP server mode
 
+# ===== RESULT CACHING ===== #
+
+# Directory for state that should survive restarts (Ollama probe result, converted documents)
+CACHE_DIR = os.path.join(os.getenv('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'mcp-markitdown')
+
+# Converted markdown keyed by cleaned URL + caption mode, and captions keyed by image hash + model
+CACHE_SIZE = int(os.getenv('MARKITDOWN_CACHE_SIZE', '256'))
+CACHE_TTL = float(os.getenv('MARKITDOWN_CACHE_TTL', '600'))
+CONVERSION_CACHE = LRUCache(CACHE_SIZE, ttl=CACHE_TTL)
+CAPTION_CACHE = LRUCache(CACHE_SIZE)
+
+
+# Converted documents kept on disk between runs, reused while their ETag/Last-Modified are unchanged
+DISK_CACHE_SIZE = int(os.getenv('MARKITDOWN_DISK_CACHE_SIZE', '512'))
+DOCUMENT_CACHE = SQLiteCache(os.path.join(CACHE_DIR, 'documents.sqlite3'), DISK_CACHE_SIZE)
+
 # ===== OLLAMA INTEGRATION ===== #
 
+# Ollama service location and vision models usable for captioning, in priority order
+OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+PREFERRED_MODELS = ("gemma3:4b", "qwen2.5vl:7b")
+# A vision model chosen by the user is tried first; untagged names mean ':latest', as in `ollama run`
+OLLAMA_VISION_MODEL = os.getenv('OLLAMA_VISION_MODEL', '')
+if OLLAMA_VISION_MODEL:
+    if ':' not in OLLAMA_VISION_MODEL:
+        OLLAMA_VISION_MODEL += ':latest'
+    PREFERRED_MODELS = (OLLAMA_VISION_MODEL,) + PREFERRED_MODELS
+# Seconds before a stalled Ollama request is abandoned, so it cannot block the caption worker forever
+OLLAMA_TIMEOUT = float(os.getenv('OLLAMA_TIMEOUT', '120'))
+
+# Successful availability checks are remembered on disk so warm starts skip the probe
+OLLAMA_CACHE_FILE = os.path.join(CACHE_DIR, 'ollama.json')
+OLLAMA_CACHE_TTL = 300
+
+# While Ollama is unavailable, captioning re-checks it at most this often (seconds)
+OLLAMA_RECHECK_INTERVAL = 60
+OLLAMA_LAST_CHECK = 0.0
+_OLLAMA_CHECK_LOCK = threading.Lock()
+
+def _read_ollama_cache(ollama_host):
+    """Return the cached preferred model for ollama_host, or None if missing or stale.
+
+    An entry recorded with a different PREFERRED_MODELS list (a new OLLAMA_VISION_MODEL,
+    say) is stale, so the newly preferred model is looked for straight away.
+    """
+    try:
+        with open(OLLAMA_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get("host") == ollama_host
+                and cached.get("preferred_models") == list(PREFERRED_MODELS)
+                and time.time() - cached.get("ts", 0) < OLLAMA_CACHE_TTL):
+            return cached.get("preferred_model")
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_ollama_cache(ollama_host, preferred_model):
+    """Atomically record a successful availability check."""
+    try:
+        os.makedirs(os.path.dirname(OLLAMA_CACHE_FILE), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(OLLAMA_CACHE_FILE), delete=False, encoding='utf-8') as f:
+            json.dump({
+                "host": ollama_host,
+                "preferred_models": list(PREFERRED_MODELS),
+                "preferred_model": preferred_model,
+                "ts": time.time()
+            }, f)
+        os.replace(f.name, OLLAMA_CACHE_FILE)
+    except OSError as e:
+        log_info(f"Could not write Ollama availability cache: {str(e)}")
+
+def get_ollama_client():
+    """Return the shared Ollama client for OLLAMA_HOST, creating it on first use.
+
+    The client keeps one pooled HTTP connection to Ollama for every caption request.
+
+    Raises:
+        ImportError: If the ollama Python package is not installed
+    """
+    global OLLAMA_CLIENT
+    if OLLAMA_CLIENT is None:
+        import ollama
+        OLLAMA_CLIENT = ollama.Client(host=OLLAMA_HOST, timeout=OLLAMA_TIMEOUT)
+    return OLLAMA_CLIENT
+
+# Dict keys that have held the model name in client.list() responses, in lookup order
+MODEL_NAME_KEYS = ('name', 'NAME', 'model')
+
+def _model_name(model):
+    """Return the name of a client.list() entry, whether it is a str, dict or Model object."""
+    if isinstance(model, str):
+        return model
+    if isinstance(model, dict):
+        return next((model[key] for key in MODEL_NAME_KEYS if model.get(key)), None)
+    return getattr(model, 'model', None) or getattr(model, 'name', None)
+
 # Function to check if Ollama is available
 def check_ollama_availability():
     """Check if Ollama is available on the system by trying to connect to it."""
-    global OLLAMA_AVAILABLE, PREFERRED_MODEL
+    global OLLAMA_AVAILABLE, PREFERRED_MODEL, OLLAMA_LAST_CHECK
+    OLLAMA_LAST_CHECK = time.monotonic()
 
     try:
-        # Try to import ollama
-        import ollama
-
-        # Get Ollama host from environment variable
-        ollama_host = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+        ollama_host = OLLAMA_HOST
         log_info(f"Attempting to connect to Ollama at: {ollama_host}")
 
-        # Create Ollama client with custom host
-        client = ollama.Client(host=ollama_host)
+        # Get (or lazily create) the shared Ollama client; raises ImportError without the package
+        client = get_ollama_client()
+
+        # Reuse a recent successful check instead of probing the service again
+        cached_model = _read_ollama_cache(ollama_host)
+        if cached_model:
+            PREFERRED_MODEL = cached_model
+            OLLAMA_AVAILABLE = True
+            log_info(f"Using cached Ollama availability: {PREFERRED_MODEL} for image captioning")
+            return True
 
         # Check if Ollama service is running by listing models
         try:
@@ -123,50 +253,24 @@ def check_ollama_availability():
 
             if models:
                 log_info("Ollama is available with the following models:")
-                model_names = []
-
+                model_names = set()
                 for model in models:
-                    try:
-                        # Handle different potential formats
-                        model_name = None
-
-                        if isinstance(model, dict):
-                            # Dictionary format
-                            if 'name' in model:
-                                model_name = model['name']
-                            elif 'NAME' in model:
-                                model_name = model['NAME']
-                            elif 'model' in model:
-                                model_name = model['model']
-                        elif isinstance(model, str):
-                            # String format
-                            model_name = model
-                        elif hasattr(model, 'model'):
-                            # Object with model attribute (like the Model class we're seeing)
-                            model_name = model.model
-                        elif hasattr(model, 'name'):
-                            # Object with name attribute
-                            model_name = model.name
-
-                        # Print and save the model name if found
-                        if model_name:
-                            log_info(f"  - {model_name}")
-                            model_names.append(model_name)
-                        else:
-                            # Fallback: print the whole model but don't use it
-                            log_info(f"  - {model} (unable to extract name)")
-                    except Exception as e:
-                        log_info(f"  - Error extracting model name: {str(e)}")
-
-                # Priority order of models
-                preferred_models = ["gemma3:4b", "qwen2.5vl:7b"]
-
-                for model in preferred_models:
-                    if model in model_names:
-                        PREFERRED_MODEL = model
-                        log_info(f"Using {PREFERRED_MODEL} for image captioning")
-                        OLLAMA_AVAILABLE = True
-                        return True
+                    model_name = _model_name(model)
+                    if model_name:
+                        log_info(f"  - {model_name}")
+                        model_names.add(model_name)
+                    else:
+                        # Fallback: print the whole model but don't use it
+                        log_info(f"  - {model} (unable to extract name)")
+
+                # Pick the first available model in priority order
+                preferred = next((m for m in PREFERRED_MODELS if m in model_names), None)
+                if preferred:
+                    PREFERRED_MODEL = preferred
+                    log_info(f"Using {PREFERRED_MODEL} for image captioning")
+                    OLLAMA_AVAILABLE = True
+                    _write_ollama_cache(ollama_host, PREFERRED_MODEL)
+                    return True
 
                 log_info("No preferred vision models available. Please install gemma3:4b or qwen2.5vl:7b")
                 OLLAMA_AVAILABLE = False
@@ -189,52 +293,130 @@ def check_ollama_availability():
 
     return OLLAMA_AVAILABLE
 
-# Function to generate image caption using Ollama
-# This uses Ollama's multimodal models to describe images
-def generate_image_caption(image_path):
-    """Generate a caption for an image using Ollama."""
-    if not OLLAMA_AVAILABLE or not PREFERRED_MODEL:
-        return "Image caption not available (Ollama or required models not found)"
+def ensure_ollama_available():
+    """Return whether captioning is possible, re-checking a down Ollama service periodically.
 
+    Lets a server started before Ollama pick it up later without probing the
+    service on every request: the check only re-runs once OLLAMA_RECHECK_INTERVAL
+    has passed since the previous one. A caption request that cannot reach Ollama
+    marks it unavailable again (see mark_ollama_unavailable), so an Ollama that
+    goes down is re-checked the same way.
+    """
+    if OLLAMA_AVAILABLE and PREFERRED_MODEL:
+        return True
+    if time.monotonic() - OLLAMA_LAST_CHECK > OLLAMA_RECHECK_INTERVAL:
+        with _OLLAMA_CHECK_LOCK:
+            # Another thread may have re-checked while this one waited for the lock
+            if time.monotonic() - OLLAMA_LAST_CHECK > OLLAMA_RECHECK_INTERVAL:
+                check_ollama_availability()
+    return bool(OLLAMA_AVAILABLE and PREFERRED_MODEL)
+
+def _is_connection_error(error):
+    """Return whether a caption request failed because Ollama could not be reached."""
+    if isinstance(error, ConnectionError):
+        return True
+    # Streamed chat requests let httpx's connect error through instead of wrapping it
     try:
-        import ollama
+        import httpx
+    except ImportError:
+        return False
+    return isinstance(error, httpx.ConnectError)
 
-        # Get Ollama host from environment variable
-        ollama_host = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+def mark_ollama_unavailable():
+    """Record that Ollama stopped answering, so ensure_ollama_available re-checks it.
 
-        # Create Ollama client with custom host
-        client = ollama.Client(host=ollama_host)
+    The availability cache on disk is dropped as well; otherwise the re-check (or
+    a restart) would trust it and mark Ollama available again without probing.
+    """
+    global OLLAMA_AVAILABLE, OLLAMA_LAST_CHECK
+    with _OLLAMA_CHECK_LOCK:
+        OLLAMA_AVAILABLE = False
+        OLLAMA_LAST_CHECK = time.monotonic()
+    try:
+        os.remove(OLLAMA_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        log_info(f"Could not remove Ollama availability cache: {str(e)}")
 
-        # Load and convert image to base64
-        with open(image_path, 'rb') as img_file:
-            img_data = img_file.read()
+def _downscale_image(img_data):
+    """Shrink an image to fit within CAPTION_MAX_SIDE and re-encode it as JPEG.
 
-        # Create the prompt for the model
-        response = client.chat(
-            model=PREFERRED_MODEL,
-            messages=[{
-                'role': 'user',
-                'content': 'Please describe this image in detail.',
-                'images': [base64.b64encode(img_data).decode('utf-8')]
-            }]
-        )
+    Images that already fit, or that Pillow cannot read, are returned unchanged.
+    """
+    try:
+        # Pillow is only needed for captioning, so it is imported on first use
+        from PIL import Image
+
+        with Image.open(io.BytesIO(img_data)) as img:
+            if max(img.size) <= CAPTION_MAX_SIDE:
+                return img_data
+            img.thumbnail((CAPTION_MAX_SIDE, CAPTION_MAX_SIDE), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, format='JPEG', quality=85)
+            return buf.getvalue()
+    except Exception as e:
+        log_info(f"Could not downscale image, sending original: {str(e)}")
+        return img_data
+
+def _stream_caption(client, img_data):
+    """Run the caption chat request with streaming and return the assembled text."""
+    chunks = []
+    for part in client.chat(
+        model=PREFERRED_MODEL,
+        messages=[{
+            'role': 'user',
+            'content': 'Please describe this image in detail.',
+            'images': [img_data]
+        }],
+        options=CAPTION_OPTIONS,
+        keep_alive=CAPTION_KEEP_ALIVE,
+        stream=True
+    ):
+        chunks.append(part['message']['content'])
+    return ''.join(chunks)
+
+# Function to generate image caption using Ollama
+# This uses Ollama's multimodal models to describe images
+def generate_image_caption(img_data):
+    """Generate a caption for an image using Ollama.
+
+    Args:
+        img_data: Raw bytes of the image; the ollama client handles the base64 encoding itself
+
+    Returns:
+        Tuple of the generated caption (or a message explaining why none is available)
+        and whether captioning succeeded, so callers never cache a failure message
+    """
+    if not ensure_ollama_available():
+        return "Image caption not available (Ollama or required models not found)", False
+
+    try:
+        # Reuse the shared client (and its connection pool) from the availability check
+        client = get_ollama_client()
 
-        # Extract the caption from the response
-        caption = response['message']['content']
-        return caption
+        # Identical images with the same model always get the cached caption
+        cache_key = (hashlib.blake2b(img_data, digest_size=16).digest(), PREFERRED_MODEL)
+        cached_caption = CAPTION_CACHE.get(cache_key)
+        if cached_caption is not None:
+            log_info("Using cached image caption")
+            return cached_caption, True
+
+        # Run inference on the dedicated Ollama worker, streaming tokens as they arrive
+        caption = OLLAMA_EXECUTOR.submit(_stream_caption, client, _downscale_image(img_data)).result()
+        CAPTION_CACHE.set(cache_key, caption)
+        return caption, True
 
     except Exception as e:
         log_info(f"Error generating image caption: {str(e)}")
-        return f"Failed to generate image caption: {str(e)}"
-
-# Check Ollama availability at startup
-log_info("Checking Ollama availability...")
-check_ollama_availability()
+        if _is_connection_error(e):
+            log_info(f"Ollama is no longer reachable, re-checking in {OLLAMA_RECHECK_INTERVAL}s")
+            mark_ollama_unavailable()
+        return f"Failed to generate image caption: {str(e)}", False
 
 # ===== MCP SERVER INITIALIZATION ===== #
 
-# Initialize MCP server with FastMCP library
-mcp = FastMCP("MarkItDown Fetch Server")
+# The FastMCP server is built by create_server() when main() runs
 
 # Configure transport mode
 # Options: "stdio" (default), "http"
@@ -242,37 +424,101 @@ DEFAULT_TRANSPORT = os.getenv('MCP_TRANSPORT', 'streamable-http')
 HTTP_PORT = int(os.getenv('MCP_HTTP_PORT', '8085'))
 HTTP_HOST = os.getenv('MCP_HTTP_HOST', '0.0.0.0')
 
+# Worker pool used by markitdown_fetch_batch to process URLs concurrently
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv('MARKITDOWN_WORKERS', '8')))
+
 
 # ===== FILE HANDLING FUNCTIONS ===== #
 
-def download_file(url):
-    """Download a file from a URL to a temporary location and return the local path.
+class _CheckedRedirectSession(requests.Session):
+    """Session that runs check_url_allowed on every redirect target before following it."""
+
+    def get_redirect_target(self, resp):
+        target = super().get_redirect_target(resp)
+        if target:
+            try:
+                check_url_allowed(urllib.parse.urljoin(resp.url, target))
+            except ValueError:
+                resp.close()
+                raise
+        return target
+
+
+# Shared HTTP session for document downloads (and markitdown's own URL fetches)
+# Reusing one connection pool lets repeated fetches skip the TCP/TLS handshake
+DOWNLOAD_SESSION = _CheckedRedirectSession()
+# Advertise every encoding urllib3 can decode here: gzip and deflate, plus br/zstd when brotli/zstandard are installed
+DOWNLOAD_SESSION.headers.update(make_headers(accept_encoding=True))
+_DOWNLOAD_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # Retry transient gateway errors; the last response is returned so raise_for_status reports it
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+)
+DOWNLOAD_SESSION.mount("http://", _DOWNLOAD_ADAPTER)
+DOWNLOAD_SESSION.mount("https://", _DOWNLOAD_ADAPTER)
+
+# File extensions handled by the image captioning path
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+
+# (connect, read) timeout in seconds for document downloads
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Download bodies up to this size stay in memory; larger ones spill to a temporary file
+DOWNLOAD_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Block size used when reading download bodies
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Documents larger than this are rejected before (or, without Content-Length, while) downloading
+MAX_DOWNLOAD_BYTES = int(os.getenv('MARKITDOWN_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# Content types no markitdown converter can turn into text; these are refused before the body is read
+UNSUPPORTED_CONTENT_TYPE_PREFIXES = ('video/', 'font/')
+
+# Build the mimetypes tables now rather than on the first download without a filename
+mimetypes.init()
+
+# Extensions for the types markitdown handles, pinned so the result does not depend on the
+# platform's mime.types, plus types mimetypes maps badly (application/xml -> .xsl) or not at all
+MIME_EXTENSION_OVERRIDES = {
+    'application/pdf': '.pdf',
+    'application/x-pdf': '.pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': '.pptx',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '.xlsx',
+    'text/html': '.html',
+    'application/xhtml+xml': '.html',
+    'application/xml': '.xml',
+    'application/rss+xml': '.rss',
+}
+
+# Extracts the filename parameter from a Content-Disposition header
+CONTENT_DISPOSITION_FILENAME_RE = re.compile(r'filename="?([^";]+)"?')
+
+
+def _download_filename(response, url):
+    """Work out a filename (and so an extension) for a downloaded document.
 
     This function handles various edge cases including:
     - Extracting filename from Content-Disposition header
     - Fallback to URL path when no filename is provided
     - Content-type based extension determination
-    - Creating appropriate temporary files with correct extensions
 
     Args:
-        url: The URL to download from
+        response: The HTTP response for the download
+        url: The URL that was downloaded
 
     Returns:
-        Path to the downloaded temporary file
-
-    Raises:
-        requests.RequestException: If the download fails
+        A filename whose extension identifies the document type
     """
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-
     # Try to get filename from Content-Disposition header
     content_disposition = response.headers.get('Content-Disposition')
     filename = None
     if content_disposition:
-        matches = re.findall('filename="?([^";]+)"?', content_disposition)
-        if matches:
-            filename = matches[0]
+        match = CONTENT_DISPOSITION_FILENAME_RE.search(content_disposition)
+        if match:
+            filename = match.group(1)
 
     # If no filename in header, extract from URL
     if not filename:
@@ -285,31 +531,195 @@ def download_file(url):
     if not filename or filename == "":
         ext = os.path.splitext(parsed_url.path)[1]
         if not ext:
-            # Try to determine extension from content-type
-            content_type = response.headers.get('Content-Type', '')
-            if 'pdf' in content_type:
-                ext = '.pdf'
-            elif 'word' in content_type or 'docx' in content_type:
-                ext = '.docx'
-            elif 'powerpoint' in content_type or 'pptx' in content_type:
-                ext = '.pptx'
-            elif 'excel' in content_type or 'xlsx' in content_type:
-                ext = '.xlsx'
-            elif 'html' in content_type:
-                ext = '.html'
-            else:
-                ext = '.bin'  # Generic binary extension
+            # Try to determine extension from content-type, falling back to a generic binary extension
+            content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+            ext = MIME_EXTENSION_OVERRIDES.get(content_type) or mimetypes.guess_extension(content_type) or '.bin'
         filename = f"downloaded{ext}"
 
-    # Create a temporary file with the correct extension
-    with tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename)[1], delete=False) as temp_file:
-        for chunk in response.iter_content(chunk_size=8192):
-            temp_file.write(chunk)
-        return temp_file.name
+    return filename
+
+
+def check_content_type(headers):
+    """Raise ValueError if the response headers announce a body markitdown cannot convert.
+
+    Args:
+        headers: Response headers from a HEAD or streamed GET request
+
+    Raises:
+        ValueError: If the Content-Type starts with one of UNSUPPORTED_CONTENT_TYPE_PREFIXES
+    """
+    content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+    if content_type.startswith(UNSUPPORTED_CONTENT_TYPE_PREFIXES):
+        raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def download_to_buffer(url):
+    """Download a document into a spooled buffer.
+
+    The body is handed to markitdown as a stream. Small documents never touch the
+    disk; anything over DOWNLOAD_SPOOL_BYTES spills to a temporary file, so a few
+    concurrent large downloads cannot hold all of their bytes in memory. Closing
+    the buffer releases it either way.
+
+    Args:
+        url: The URL to download from
+
+    Returns:
+        Tuple of a SpooledTemporaryFile holding the body (positioned at the start)
+        and the filename detected for it
+
+    Raises:
+        requests.RequestException: If the download fails
+        ValueError: If the body is larger than MAX_DOWNLOAD_BYTES or of an unsupported type
+    """
+    # The with block hands the pooled connection back once the body has been read
+    with DOWNLOAD_SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        # Only the headers have arrived; closing here abandons the body unread
+        check_content_type(response.headers)
+        filename = _download_filename(response, url)
+
+        # decode_content keeps gzip/deflate handling
+        response.raw.decode_content = True
+        buffer = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_BYTES)
+        try:
+            size = 0
+            for chunk in iter(lambda: response.raw.read(DOWNLOAD_CHUNK_SIZE), b''):
+                size += len(chunk)
+                # Stop as soon as the limit is passed, for servers that sent no Content-Length
+                if size > MAX_DOWNLOAD_BYTES:
+                    raise ValueError(f"Document is too large to convert (limit is {MAX_DOWNLOAD_BYTES} bytes)")
+                buffer.write(chunk)
+        except BaseException:
+            buffer.close()
+            raise
+
+    buffer.seek(0)
+    log_info(f"Downloaded {filename} ({size} bytes)")
+    return buffer, filename
+
+
+# Only web URLs are fetched; file:, data:, javascript: and bare paths never hit the network or disk
+ALLOWED_URL_SCHEMES = frozenset({'http', 'https'})
+
+# Set to fetch from localhost and private, link-local or reserved addresses (e.g. an intranet)
+ALLOW_PRIVATE_HOSTS = os.getenv('MARKITDOWN_ALLOW_PRIVATE_HOSTS', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def _is_private_address(address):
+    """Return True if an ipaddress address is loopback, private, link-local, reserved or unspecified."""
+    # An IPv4 address wrapped in IPv6 (::ffff:127.0.0.1) reaches the IPv4 host
+    if address.version == 6 and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return (address.is_private or address.is_loopback or address.is_link_local
+            or address.is_reserved or address.is_unspecified or address.is_multicast)
+
+
+def check_url_allowed(url):
+    """Reject URLs that cannot or should not be fetched.
+
+    The host is resolved and refused if any address it resolves to is private,
+    so neither DNS names pointing at internal hosts nor shorthand IP forms
+    (127.1, 2130706433, 0x7f000001) get through. DOWNLOAD_SESSION runs the same
+    check on every redirect target before following it.
+
+    Args:
+        url: The cleaned URL about to be fetched
+
+    Raises:
+        ValueError: If the scheme is not http(s), the host is missing or cannot be
+            resolved, or the host resolves to a private address
+    """
+    parsed = urlparse(url)
+    if parsed.scheme.lower() not in ALLOWED_URL_SCHEMES:
+        raise ValueError(f"Unsupported URL scheme: {parsed.scheme or '(none)'}; only http and https URLs can be fetched")
+
+    host = parsed.hostname
+    if not host:
+        raise ValueError("URL has no host")
+    if ALLOW_PRIVATE_HOSTS:
+        return
+
+    if host == 'localhost' or host.endswith('.localhost'):
+        raise ValueError(f"Refusing to fetch from private host: {host}")
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError) as e:
+        raise ValueError(f"Could not resolve host {host}: {e}")
+    for address in addresses:
+        # Drop the zone index of scoped IPv6 addresses (fe80::1%eth0)
+        if _is_private_address(ipaddress.ip_address(address.split('%', 1)[0])):
+            raise ValueError(f"Refusing to fetch from private host: {host}")
+
+
+def check_download_size(url):
+    """Reject a URL whose HEAD response reports a body too large or of an unsupported type.
+
+    Servers that refuse HEAD requests or omit Content-Length are let through;
+    the check only exists to avoid fetching documents that are obviously too big
+    or that no converter can read (see check_content_type).
+
+    Args:
+        url: The URL about to be fetched
+
+    Returns:
+        The HEAD response headers, or None if the HEAD request failed or was refused
+
+    Raises:
+        ValueError: If the reported Content-Length exceeds MAX_DOWNLOAD_BYTES, or the
+            Content-Type is unsupported
+    """
+    try:
+        head = DOWNLOAD_SESSION.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+    except requests.RequestException as e:
+        log_info(f"HEAD request failed, skipping size check: {str(e)}")
+        return None
+
+    if not head.ok:
+        return None
+    content_length = head.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > MAX_DOWNLOAD_BYTES:
+        raise ValueError(
+            f"Document is too large to convert ({int(content_length)} bytes, limit is {MAX_DOWNLOAD_BYTES})"
+        )
+    check_content_type(head.headers)
+    return head.headers
+
+
+def is_image_file(path):
+    """Return True if path has one of the IMAGE_EXTENSIONS (case-insensitive)."""
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+# Comma-separated hosts whose connections are opened at server startup
+WARM_HOSTS = tuple(h.strip() for h in os.getenv('MARKITDOWN_WARM_HOSTS', '').split(',') if h.strip())
+
+
+def warm_connections(hosts):
+    """Open a pooled HTTPS connection to each host so the first fetch skips DNS and TLS setup.
+
+    Errors are ignored; an unreachable host just means its first fetch pays the
+    handshake as it would have anyway.
+
+    Args:
+        hosts: Host names (optionally with a port) to connect to
+    """
+    for host in hosts:
+        try:
+            DOWNLOAD_SESSION.head(f"https://{host}/", timeout=3).close()
+        except (requests.RequestException, ValueError) as e:
+            log_info(f"Could not warm connection to {host}: {str(e)}")
 
 
 # ===== YOUTUBE HANDLING FUNCTIONS ===== #
 
+# Matches every URL form extract_video_id understands: watch?v=, embed/, v/ and youtu.be
+YOUTUBE_URL_RE = re.compile(
+    r'^(?:https?://)?(?:(?:www\.|m\.)?youtube\.com/(?:watch/?\?(?:[^#]*&)?v=|embed/|v/)|youtu\.be/)',
+    re.IGNORECASE
+)
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if a URL is a YouTube URL.
 
@@ -325,27 +735,10 @@ def is_youtube_url(url: str) -> bool:
     Returns:
         True if the URL is a YouTube URL, False otherwise
     """
-    parsed_url = urlparse(url)
-
-    # Check for youtu.be domain
-    if parsed_url.hostname == "youtu.be":
-        return True
-
-    # Check for youtube.com domains
-    if parsed_url.hostname in ("youtube.com", "www.youtube.com", "m.youtube.com"):
-        # Standard watch URLs with v parameter
-        if "v" in urllib.parse.parse_qs(parsed_url.query):
-            return True
-
-        # Embed URLs
-        if parsed_url.path.startswith("/embed/"):
-            return True
-
-        # Direct video URLs
-        if parsed_url.path.startswith("/v/"):
-            return True
-
-    return False
+    # Cheap substring test rejects the common non-YouTube case before the regex runs
+    if "youtu" not in url.lower():
+        return False
+    return YOUTUBE_URL_RE.match(url) is not None
 
 
 def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optional[str] = None) -> dict:
@@ -371,8 +764,15 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
     """
     log_info(f"Processing YouTube URL: {url} with custom transcript fetcher")
 
+    # Parse the video ID once so the fallback messages below can link to the video
     try:
-        # Get video info to include richer metadata
+        video_id = extract_video_id(url)
+    except ValueError:
+        video_id = "unknown"
+
+    try:
+        # Get video info to include richer metadata; fetched first so the transcript
+        # lookup takes the title from it instead of scraping the watch page
         video_info = get_youtube_video_info(url)
 
         # Use our custom YouTube transcript fetcher with pagination support
@@ -387,7 +787,7 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
             next_cursor = result.get("next_cursor")
 
             # Create a richer markdown with video metadata if available
-            markdown = f"# {title}\n\n"
+            parts = [f"# {title}\n\n"]
 
             # Add video info if available
             if video_info.get("success"):
@@ -397,18 +797,20 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
                 upload_date = upload_date_obj.strftime("%B %d, %Y") if upload_date_obj else "Unknown date"
                 duration = video_info.get("duration", "Unknown duration")
 
-                markdown += f"**Creator:** {uploader}\n\n"
-                markdown += f"**Upload Date:** {upload_date}\n\n"
-                markdown += f"**Duration:** {duration}\n\n"
+                parts.append(f"**Creator:** {uploader}\n\n")
+                parts.append(f"**Upload Date:** {upload_date}\n\n")
+                parts.append(f"**Duration:** {duration}\n\n")
 
                 if description and len(description) > 0:
                     # Truncate very long descriptions
                     if len(description) > 500:
                         description = description[:500] + "..."
-                    markdown += f"**Description:**\n\n{description}\n\n"
+                    parts.append(f"**Description:**\n\n{description}\n\n")
 
             # Add transcript with language information
-            markdown += f"## Transcript ({language})\n\n{transcript}"
+            parts.append(f"## Transcript ({language})\n\n")
+            parts.append(transcript)
+            markdown = "".join(parts)
 
             # Add pagination information if available
             has_more = next_cursor is not None
@@ -425,10 +827,10 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
 
             # Return a more user-friendly markdown instead of failing
             title = result.get("title", "YouTube Video")
-            video_id = result.get("video_id", extract_video_id(url) if "youtube" in url else "unknown")
+            video_id = result.get("video_id", video_id)
 
             # Try to get video info even if transcript failed
-            video_metadata = ""
+            video_metadata = []
             if "title" in video_info and video_info["success"]:
                 title = video_info["title"]  # Use the better title if available
                 uploader = video_info.get("uploader", "Unknown")
@@ -436,20 +838,16 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
                 upload_date = upload_date_obj.strftime("%B %d, %Y") if upload_date_obj else "Unknown date"
                 duration = video_info.get("duration", "Unknown duration")
 
-                video_metadata += f"**Creator:** {uploader}\n\n"
-                video_metadata += f"**Upload Date:** {upload_date}\n\n"
-                video_metadata += f"**Duration:** {duration}\n\n"
+                video_metadata.append(f"**Creator:** {uploader}\n\n")
+                video_metadata.append(f"**Upload Date:** {upload_date}\n\n")
+                video_metadata.append(f"**Duration:** {duration}\n\n")
 
-            # Create a markdown response with the error and a direct link
-            markdown = f"# {title}\n\n"
-
-            # Add video info if available
-            if video_metadata:
-                markdown += video_metadata
-
-            markdown += f"## Transcript Unavailable\n\nUnable to retrieve transcript for this video due to YouTube rate limiting or transcript unavailability.\n\n"
-            markdown += f"Please visit the video directly: [Watch on YouTube](https://www.youtube.com/watch?v={video_id})\n\n"
-            markdown += f"Error details: {error}"
+            # Create a markdown response with the error and a direct link, adding video info if available
+            parts = [f"# {title}\n\n", *video_metadata]
+            parts.append("## Transcript Unavailable\n\nUnable to retrieve transcript for this video due to YouTube rate limiting or transcript unavailability.\n\n")
+            parts.append(f"Please visit the video directly: [Watch on YouTube](https://www.youtube.com/watch?v={video_id})\n\n")
+            parts.append(f"Error details: {error}")
+            markdown = "".join(parts)
 
             # This isn't an exception - we're returning a useful markdown response instead
             return {"markdown": markdown, "next_cursor": None, "has_more": False}
@@ -458,29 +856,313 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
         log_info(f"Error in custom YouTube transcript processing: {str(e)}")
 
         try:
-            # Try to at least get the title and video ID
-            if "youtube" in url:
-                video_id = extract_video_id(url)
-                title = "YouTube Video"
-            else:
-                video_id = "unknown"
-                title = "Unknown Video"
+            # Try to at least get the title; the video ID was parsed up front
+            title = "YouTube Video" if video_id != "unknown" else "Unknown Video"
 
             # Create a markdown response with the error and a direct link
-            markdown = f"# {title}\n\n## Transcript Unavailable\n\nUnable to retrieve transcript for this video due to an error.\n\n"
-            markdown += f"Please visit the video directly: [Watch on YouTube](https://www.youtube.com/watch?v={video_id})\n\n"
-            markdown += f"Error details: {str(e)}"
+            markdown = "".join([
+                f"# {title}\n\n## Transcript Unavailable\n\nUnable to retrieve transcript for this video due to an error.\n\n",
+                f"Please visit the video directly: [Watch on YouTube](https://www.youtube.com/watch?v={video_id})\n\n",
+                f"Error details: {str(e)}"
+            ])
 
             return {"markdown": markdown, "next_cursor": None, "has_more": False}
-        except:
+        except Exception:
             # Last resort fallback
             error_msg = f"Failed to process YouTube URL: {str(e)}"
             return {"markdown": error_msg, "next_cursor": None, "has_more": False}
 
 
+# ===== CONVERSION PIPELINE ===== #
+
+# MarkItDown converter shared by every request; plugin discovery runs only once
+MARKITDOWN_CONVERTER = None
+_MARKITDOWN_LOCK = threading.Lock()
+
+# C0 control characters other than tab, newline and carriage return; these break JSON clients
+CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def get_markitdown():
+    """Return the shared MarkItDown converter, creating it on first use."""
+    global MARKITDOWN_CONVERTER
+    if MARKITDOWN_CONVERTER is None:
+        with _MARKITDOWN_LOCK:
+            if MARKITDOWN_CONVERTER is None:
+                from markitdown import MarkItDown
+                # Plugins enable YouTube support via the built-in YouTubeConverter as fallback;
+                # direct URL conversions share the download session's pooled connections
+                MARKITDOWN_CONVERTER = MarkItDown(enable_plugins=True, requests_session=DOWNLOAD_SESSION)
+    return MARKITDOWN_CONVERTER
+
+
+# Worker processes for converting downloaded documents; 0 converts in the calling thread
+CONVERT_PROCESSES = int(os.getenv('MARKITDOWN_CONVERT_PROCESSES', '0'))
+# Seconds to wait for a worker process before giving up on a conversion
+CONVERT_TIMEOUT = 300
+CONVERT_POOL = None
+_CONVERT_POOL_LOCK = threading.Lock()
+
+def _discard_convert_pool(pool):
+    """Stop pool's workers and forget it, so the next conversion starts a fresh pool.
+
+    A crashed worker leaves the pool broken for good, and a worker stuck on a bad
+    document keeps its slot after the caller times out. The executor cannot tell
+    which process holds a given task, so every worker is terminated; conversions
+    still running in it fail with BrokenProcessPool.
+    """
+    global CONVERT_POOL
+    with _CONVERT_POOL_LOCK:
+        if CONVERT_POOL is pool:
+            CONVERT_POOL = None
+    terminate_workers = getattr(pool, 'terminate_workers', None)
+    if terminate_workers is not None:
+        # Python 3.14+
+        terminate_workers()
+        return
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def convert_document(buffer, file_extension):
+    """Convert a downloaded document to markdown text.
+
+    With MARKITDOWN_CONVERT_PROCESSES set, the CPU-heavy parsing runs in a
+    ProcessPoolExecutor so a large PDF does not hold the GIL while other tool
+    calls are waiting. Workers run convert_worker.convert_file on a file holding
+    the body, so the document is neither read into memory here nor pickled.
+    Otherwise the buffer is converted in the calling thread.
+
+    Args:
+        buffer: Seekable binary file holding the document body, positioned at the start
+        file_extension: Extension (e.g. '.pdf') used to pick the converter
+
+    Returns:
+        The converted markdown text
+
+    Raises:
+        TimeoutError: If a worker takes longer than CONVERT_TIMEOUT
+        BrokenProcessPool: If a worker died during the conversion
+    """
+    global CONVERT_POOL
+    if CONVERT_PROCESSES <= 0:
+        return get_markitdown().convert_stream(buffer, file_extension=file_extension).text_content
+    # Held locally, since a failed conversion in another thread may discard the global pool
+    pool = CONVERT_POOL
+    if pool is None:
+        with _CONVERT_POOL_LOCK:
+            if CONVERT_POOL is None:
+                # The server is already running threads (executors, the SQLite cache), which forking copies
+                # in an unknown state; a forkserver starts workers from a clean single-threaded process
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+                CONVERT_POOL = ProcessPoolExecutor(
+                    max_workers=CONVERT_PROCESSES,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+            pool = CONVERT_POOL
+    # The spool has no path of its own (in memory, or an unnamed file once rolled over), so
+    # its contents are copied to a named file in DOWNLOAD_CHUNK_SIZE blocks for the worker
+    with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as spill:
+        shutil.copyfileobj(buffer, spill, DOWNLOAD_CHUNK_SIZE)
+    try:
+        return pool.submit(convert_file, spill.name, file_extension).result(timeout=CONVERT_TIMEOUT)
+    except (BrokenProcessPool, TimeoutError):
+        log_info("Conversion worker crashed or timed out, restarting the process pool")
+        _discard_convert_pool(pool)
+        raise
+    finally:
+        os.remove(spill.name)
+
+
+def _do_fetch(url: str, next_cursor: Optional[str] = None, response_limit: int = 50000) -> dict:
+    """Fetch a single URL and convert it to markdown.
+
+    This is the shared pipeline behind the MCP tools and the --test command:
+    1. URL sanitization
+    2. YouTube-specific handling for transcript extraction
+    3. Direct URL conversion with markitdown
+    4. Download (spooled in memory) and stream conversion as fallback
+    5. Special handling for images with AI-powered captioning
+
+    Args:
+        url: The URL pointing to the document to fetch and convert
+        next_cursor: Optional cursor for paginated content retrieval
+        response_limit: Maximum characters to return per request
+
+    Returns:
+        Dictionary with markdown, next_cursor and has_more keys
+
+    Raises:
+        Exception: If every conversion method fails
+    """
+    log_info(f"Processing URL: {url}")
+
+    # Clean up URL - remove quotes and brackets that might be accidentally included
+    url = url.strip(' \t\r\n"\'[]')
+
+    # Fail fast on URLs that could never be fetched (or must not be)
+    check_url_allowed(url)
+
+    # First check if this is a YouTube URL
+    if is_youtube_url(url):
+        try:
+            # Try our custom YouTube transcript handler with pagination support
+            log_info(f"Detected YouTube URL, using custom transcript handler")
+            result = process_youtube_url(url, response_limit, next_cursor)
+
+            # Get the markdown content from the result
+            content = result["markdown"]
+
+            # Normalize line endings for consistency
+            content = content.replace('\r\n', '\n')
+
+            # Strip any problematic characters that might cause JSON issues
+            content = CONTROL_CHAR_RE.sub('', content)
+
+            # Return the result with pagination information
+            return {
+                "markdown": content,
+                "next_cursor": result.get("next_cursor"),
+                "has_more": result.get("has_more", False)
+            }
+        except Exception as e:
+            log_info(f"Custom YouTube transcript handler failed: {str(e)}")
+            log_info(f"Falling back to markitdown's built-in YouTube support")
+            # Fall through to markitdown's method if our custom handler fails
+
+    # Serve repeat requests for the same document from the conversion cache; the caption
+    # mode is part of the key so images are reconverted when Ollama comes or goes
+    cache_key = (url, OLLAMA_AVAILABLE, PREFERRED_MODEL)
+    cached = CONVERSION_CACHE.get(cache_key)
+    if cached is not None:
+        log_info(f"Conversion cache hit for {url}")
+        return dict(cached)
+
+    # Refuse oversized or unconvertible documents before markitdown or download_to_buffer fetch the body
+    head_headers = check_download_size(url) or {}
+
+    # A document whose ETag/Last-Modified are unchanged since its last conversion is
+    # served from the on-disk cache without downloading or parsing it again; one
+    # without either validator is never stored, since a change could not be noticed
+    etag = head_headers.get('ETag')
+    last_modified = head_headers.get('Last-Modified')
+    validators = [etag, last_modified] if etag or last_modified else None
+    stored = DOCUMENT_CACHE.get(cache_key, validators=validators) if validators else None
+    if stored is not None:
+        log_info(f"Document unchanged since last conversion, using disk cache for {url}")
+        CONVERSION_CACHE.set(cache_key, stored)
+        return dict(stored)
+
+    # Reuse the shared MarkItDown converter (plugins enabled)
+    md = get_markitdown()
+    from markitdown import MarkItDownException
+
+    try:
+        # Try direct conversion with the URL
+        # This will use markitdown's built-in YouTube handling for YouTube URLs
+        log_info(f"Attempting direct URL conversion with markitdown...")
+        result = md.convert(url)
+        if result and hasattr(result, 'text_content') and result.text_content:
+            content = result.text_content
+            log_info(f"Direct URL conversion successful, content length: {len(content)}")
+
+            # Normalize line endings for consistency
+            content = content.replace('\r\n', '\n')
+
+            # Strip any problematic characters that might cause JSON issues
+            content = CONTROL_CHAR_RE.sub('', content)
+
+            result = {
+                "markdown": content,
+                "next_cursor": None,
+                "has_more": False
+            }
+            CONVERSION_CACHE.set(cache_key, result)
+            if validators:
+                DOCUMENT_CACHE.set(cache_key, result, validators=validators)
+            return dict(result)
+    except (requests.RequestException, MarkItDownException, ValueError) as e:
+        # Expected when the URL needs the download path (unsupported format, failed fetch)
+        log_info(f"Direct URL conversion failed: {str(e)}")
+
+    # If direct URL conversion failed or for non-URL inputs, download the file and try again
+    log_info(f"Downloading file for conversion...")
+    buffer, filename = download_to_buffer(url)
+
+    # Only a failed image caption makes a result unfit for caching
+    cacheable = True
+    with buffer:
+        # Images go straight to captioning; markitdown yields no text for them anyway
+        if is_image_file(filename):
+            image_markdown = f"![Image from {url}]({url})"
+
+            # If Ollama is available, generate a caption
+            captioning = ensure_ollama_available()
+            # The re-check above may have just switched captioning on; key the result by the
+            # mode it is actually produced in, as the next lookup for this URL will
+            cache_key = (url, OLLAMA_AVAILABLE, PREFERRED_MODEL)
+            if captioning:
+                log_info(f"Generating image caption using {PREFERRED_MODEL}...")
+                caption, cacheable = generate_image_caption(buffer.read())
+                content = f"{image_markdown}\n\n## Image Description\n\n{caption}"
+                log_info(f"Added image with AI-generated caption")
+            else:
+                content = f"{image_markdown}\n\n*This is an image file. For detailed image description, install Ollama with gemma3:4b or qwen2.5vl:7b.*"
+                log_info(f"Added basic image tag for image file")
+        else:
+            content = convert_document(buffer, os.path.splitext(filename)[1])
+
+    log_info(f"Conversion successful, content length: {len(content)}")
+
+    result = {
+        "markdown": content,
+        "next_cursor": None,
+        "has_more": False
+    }
+    if cacheable:
+        # A caption failure would otherwise be served for this URL until the entries expire
+        # (in memory) or the image changes (on disk), which for most images is never
+        CONVERSION_CACHE.set(cache_key, result)
+        if validators:
+            DOCUMENT_CACHE.set(cache_key, result, validators=validators)
+    return dict(result)
+
+
+def _process_url(url: str, next_cursor: Optional[str] = None, response_limit: int = 50000) -> dict:
+    """Run _do_fetch and report any failure as markdown instead of raising.
+
+    Shared by the markitdown_fetch and markitdown_fetch_batch tools, so one bad
+    URL never breaks a batch.
+    """
+    try:
+        return _do_fetch(url, next_cursor, response_limit)
+    except Exception as e:
+        log_info(f"Error: {str(e)}")
+        return {
+            "markdown": f"Error processing {url}: {str(e)}",
+            "next_cursor": None,
+            "has_more": False
+        }
+
+
+def _process_batch(urls: list[str], response_limit: int = 50000) -> list[dict]:
+    """Run _process_url for several URLs concurrently on FETCH_EXECUTOR.
+
+    Shared by the markitdown_fetch_batch tool and the multi-URL --test mode.
+
+    Returns:
+        One result dict (with the url added) per input URL, in input order
+    """
+    # Fetch each distinct URL once, even if the batch repeats it
+    unique_urls = list(dict.fromkeys(urls))
+    log_info(f"Processing batch of {len(urls)} URLs ({len(unique_urls)} unique)")
+    results = dict(zip(unique_urls, FETCH_EXECUTOR.map(lambda u: _process_url(u, None, response_limit), unique_urls)))
+    return [{"url": u, **results[u]} for u in urls]
+
+
 # ===== MCP TOOL DEFINITION ===== #
 
-@mcp.tool(
+# Registration options for markitdown_fetch (see create_server)
+MARKITDOWN_FETCH_TOOL = dict(
     name="markitdown_fetch",
     description="Fetch a document from a URL and convert it to markdown format. Supports PDF, DOCX, PPTX, XLSX, HTML, YouTube transcripts, and images.",
     output_schema={
@@ -501,6 +1183,8 @@ def process_youtube_url(url: str, response_limit: int = -1, next_cursor: Optiona
         }
     }
 )
+
+
 def markitdown_fetch(
     url: str = None,  # URL pointing to the document to fetch and convert
     next_cursor: str = None,  # Cursor for pagination of long content
@@ -547,248 +1231,158 @@ def markitdown_fetch(
         - next_cursor: Pagination cursor for subsequent requests (if applicable)
         - has_more: Boolean indicating if more content is available
     """
-    try:
-        log_info(f"Processing URL: {url}")
+    return _process_url(url, next_cursor, response_limit)
 
-        # Clean up URL - remove quotes and brackets that might be accidentally included
-        url = url.strip().rstrip('"\'[]')
 
-        # First check if this is a YouTube URL
-        if is_youtube_url(url):
-            try:
-                # Try our custom YouTube transcript handler with pagination support
-                log_info(f"Detected YouTube URL, using custom transcript handler")
-                result = process_youtube_url(url, response_limit, next_cursor)
-
-                # Get the markdown content from the result
-                content = result["markdown"]
-
-                # Normalize line endings for consistency
-                content = content.replace('\r\n', '\n')
-
-                # Strip any problematic characters that might cause JSON issues
-                content = ''.join(c for c in content if ord(c) >= 32 or c in '\n\r\t')
-
-                # Return the result with pagination information
-                return {
-                    "markdown": content,
-                    "next_cursor": result.get("next_cursor"),
-                    "has_more": result.get("has_more", False)
+# Registration options for markitdown_fetch_batch (see create_server)
+MARKITDOWN_FETCH_BATCH_TOOL = dict(
+    name="markitdown_fetch_batch",
+    description="Fetch several documents concurrently and convert each to markdown format. Accepts the same URL types as markitdown_fetch.",
+    output_schema={
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "description": "One markitdown_fetch result per input URL, in input order",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "url": {"type": "string"},
+                        "markdown": {"type": "string"},
+                        "next_cursor": {"type": ["string", "null"]},
+                        "has_more": {"type": "boolean"}
+                    }
                 }
-            except Exception as e:
-                log_info(f"Custom YouTube transcript handler failed: {str(e)}")
-                log_info(f"Falling back to markitdown's built-in YouTube support")
-                # Fall through to markitdown's method if our custom handler fails
+            }
+        }
+    }
+)
 
-        # Initialize MarkItDown converter with plugins enabled
-        # This enables YouTube support via the built-in YouTubeConverter as fallback
-        md = MarkItDown(enable_plugins=True)
 
-        try:
-            # Try direct conversion with the URL
-            # This will use markitdown's built-in YouTube handling for YouTube URLs
-            log_info(f"Attempting direct URL conversion with markitdown...")
-            result = md.convert(url)
-            if result and hasattr(result, 'text_content') and result.text_content:
-                content = result.text_content
-                log_info(f"Direct URL conversion successful, content length: {len(content)}")
-
-                # Normalize line endings for consistency
-                content = content.replace('\r\n', '\n')
-
-                # Strip any problematic characters that might cause JSON issues
-                content = ''.join(c for c in content if ord(c) >= 32 or c in '\n\r\t')
-
-                return {
-                    "markdown": content,
-                    "next_cursor": None,
-                    "has_more": False
-                }
-        except Exception as e:
-            log_info(f"Direct URL conversion failed: {str(e)}")
+def markitdown_fetch_batch(
+    urls: list[str],  # URLs pointing to the documents to fetch and convert
+    response_limit: int = 50000  # Maximum characters to return per document
+) -> dict:
+    """Fetch and convert multiple URLs in parallel.
 
-        # If direct URL conversion failed or for non-URL inputs, download the file and try again
-        log_info(f"Downloading file for conversion...")
-        local_path = download_file(url)
-        log_info(f"Downloaded file to: {local_path}")
+    Downloads, yt-dlp calls and Ollama requests spend most of their time waiting
+    on sockets, so the URLs are fanned out over FETCH_EXECUTOR threads.
 
-        # Convert the file to markdown
-        result = md.convert(local_path)
-        content = result.text_content
+    Args:
+        urls: The URLs pointing to the documents to fetch and convert
+        response_limit: Maximum characters to return per document (default: 50000)
 
-        # For images, if content is empty, provide enhanced content using Ollama when available
-        if os.path.splitext(local_path)[1].lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'] and not content:
-            image_markdown = f"![Image from {url}]({url})"
+    Returns:
+        Dictionary containing a results list with one entry per URL, in input order
+    """
+    return {"results": _process_batch(urls, response_limit)}
 
-            # If Ollama is available, generate a caption
-            if OLLAMA_AVAILABLE and PREFERRED_MODEL:
-                log_info(f"Generating image caption using {PREFERRED_MODEL}...")
-                caption = generate_image_caption(local_path)
-                content = f"{image_markdown}\n\n## Image Description\n\n{caption}"
-                log_info(f"Added image with AI-generated caption")
-            else:
-                content = f"{image_markdown}\n\n*This is an image file. For detailed image description, install Ollama with gemma3:4b or qwen2.5vl:7b.*"
-                log_info(f"Added basic image tag for image file")
 
-        log_info(f"Conversion successful, content length: {len(content)}")
+def create_server():
+    """Create the FastMCP server and register the markitdown tools on it."""
+    server = FastMCP("MarkItDown Fetch Server")
+    server.tool(**MARKITDOWN_FETCH_TOOL)(markitdown_fetch)
+    server.tool(**MARKITDOWN_FETCH_BATCH_TOOL)(markitdown_fetch_batch)
+    return server
 
-        # Clean up temporary file
-        os.remove(local_path)
 
-        return {
-            "markdown": content,
-            "next_cursor": None,
-            "has_more": False
-        }
+# ===== TEST FUNCTIONS ===== #
 
-    except Exception as e:
-        log_info(f"Error: {str(e)}")
-        return {
-            "markdown": f"Error processing {url}: {str(e)}",
-            "next_cursor": None,
-            "has_more": False
-        }
+# Characters of each result shown by the --test commands
+PREVIEW_CHARS = 500
 
+def _log_preview(heading, markdown_content):
+    """Log a heading and the start of a result without flooding the console."""
+    # Short results are logged as-is; long ones are sliced once, with no intermediate preview string
+    if len(markdown_content) <= PREVIEW_CHARS:
+        log_info(f"{heading}\n{markdown_content}")
+    else:
+        log_info(f"{heading}\n{markdown_content[:PREVIEW_CHARS]}...")
 
-# ===== TEST FUNCTIONS ===== #
 
 def test_markitdown_fetch(url, next_cursor=None, response_limit=50000):
     """Test function to try markitdown_fetch functionality directly without starting the MCP server.
 
-    This function mirrors the behavior of the MCP tool but is designed for direct
+    This runs the same pipeline as the MCP tool but is designed for direct
     command-line testing with the --test flag. It provides detailed console output
     of the conversion process and a preview of the result.
     """
     log_info(f"Testing markitdown_fetch with URL: {url}")
     try:
-        # Clean up URL - remove quotes and brackets that might be accidentally included
-        url = url.strip().rstrip('"\'[]')
-        log_info(f"Processing URL: {url}")
+        result = _do_fetch(url, next_cursor, response_limit)
+        markdown_content = result["markdown"]
 
-        # Initialize MarkItDown converter with plugins enabled
-        # This enables YouTube support via the built-in YouTubeConverter
-        md = MarkItDown(enable_plugins=True)
+        # Show pagination info if available
+        if result.get("next_cursor"):
+            log_info(f"Pagination: More content available. Next cursor: {result['next_cursor']}")
 
-        # First check if this is a YouTube URL
-        if is_youtube_url(url):
-            try:
-                # Try our custom YouTube transcript handler with pagination support
-                log_info(f"Detected YouTube URL, using custom transcript handler")
-                result = process_youtube_url(url, response_limit, next_cursor)
-                markdown_content = result["markdown"]
-
-                # Show pagination info if available
-                if result.get("next_cursor"):
-                    log_info(f"Pagination: More content available. Next cursor: {result['next_cursor']}")
-
-                # Normalize line endings for consistency
-                markdown_content = markdown_content.replace('\r\n', '\n')
-
-                # Strip any problematic characters that might cause JSON issues
-                markdown_content = ''.join(c for c in markdown_content if ord(c) >= 32 or c in '\n\r\t')
-                log_info(f"Custom YouTube transcript handler successful, content length: {len(markdown_content)}")
-            except Exception as e:
-                log_info(f"Custom YouTube transcript handler failed: {str(e)}")
-                log_info(f"Falling back to markitdown's built-in YouTube support")
-
-                # Fall back to markitdown's built-in handling
-                try:
-                    log_info(f"Attempting direct URL conversion with markitdown...")
-                    result = md.convert(url)
-                    if result and hasattr(result, 'text_content') and result.text_content:
-                        markdown_content = result.text_content
-                        log_info(f"Markitdown conversion successful, content length: {len(markdown_content)}")
-
-                        # Normalize line endings for consistency
-                        markdown_content = markdown_content.replace('\r\n', '\n')
-
-                        # Strip any problematic characters that might cause JSON issues
-                        markdown_content = ''.join(c for c in markdown_content if ord(c) >= 32 or c in '\n\r\t')
-                    else:
-                        raise Exception("Markitdown conversion returned empty result")
-                except Exception as e2:
-                    log_info(f"Markitdown YouTube handling also failed: {str(e2)}")
-                    raise Exception(f"Both custom and markitdown YouTube handlers failed: {str(e)}, {str(e2)}")
-        else:
-            # For non-YouTube URLs, use regular markitdown conversion
-            try:
-                log_info(f"Attempting direct URL conversion with markitdown...")
-                result = md.convert(url)
-                if result and hasattr(result, 'text_content') and result.text_content:
-                    markdown_content = result.text_content
-                    log_info(f"Direct URL conversion successful, content length: {len(markdown_content)}")
-
-                    # Normalize line endings for consistency
-                    markdown_content = markdown_content.replace('\r\n', '\n')
-
-                    # Strip any problematic characters that might cause JSON issues
-                    markdown_content = ''.join(c for c in markdown_content if ord(c) >= 32 or c in '\n\r\t')
-                else:
-                    raise Exception("Direct URL conversion returned empty result")
-            except Exception as e:
-                log_info(f"Direct URL conversion failed: {str(e)}")
-                raise
-        # If direct URL conversion or YouTube handling failed, download the file and try again
-        log_info(f"Downloading file for conversion...")
-        local_path = download_file(url)
-        log_info(f"Downloaded file to: {local_path}")
+        _log_preview("Preview:", markdown_content)
+        return markdown_content
+    except Exception as e:
+        log_info(f"Test failed: {str(e)}")
+        return None
 
-        # Convert the file to markdown
-        conversion_result = md.convert(local_path)
-        markdown_content = conversion_result.text_content
 
-        # For images, if content is empty, provide enhanced content using Ollama when available
-        if os.path.splitext(local_path)[1].lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'] and not markdown_content:
-            image_markdown = f"![Image from {url}]({url})"
+def test_markitdown_fetch_batch(urls, response_limit=50000):
+    """Test several URLs concurrently, the way markitdown_fetch_batch processes them.
 
-            # If Ollama is available, generate a caption
-            if OLLAMA_AVAILABLE and PREFERRED_MODEL:
-                log_info(f"Generating image caption using {PREFERRED_MODEL}...")
-                caption = generate_image_caption(local_path)
-                markdown_content = f"{image_markdown}\n\n## Image Description\n\n{caption}"
-                log_info(f"Added image with AI-generated caption")
-            else:
-                markdown_content = f"{image_markdown}\n\n*This is an image file. For detailed image description, install Ollama with gemma3:4b or qwen2.5vl:7b.*"
-                log_info(f"Added basic image tag for image file")
+    Log lines from the worker threads interleave while the URLs are fetched; the
+    previews are printed afterwards in argument order.
+    """
+    log_info(f"Testing markitdown_fetch_batch with {len(urls)} URLs")
+    results = _process_batch(urls, response_limit)
+    for result in results:
+        _log_preview(f"\n===== {result['url']} =====", result["markdown"])
+    return results
 
-        log_info(f"Conversion successful, content length: {len(markdown_content)}")
 
-        # Clean up temporary file
-        os.remove(local_path)
+# ===== MAIN ENTRY POINT ===== #
 
-        # Print only the first 500 characters of the result to avoid flooding the console
-        preview = markdown_content[:500] + "..." if len(markdown_content) > 500 else markdown_content
-        log_info(f"Preview:\n{preview}")
-        return markdown_content
-    except Exception as e:
-        log_info(f"Test failed: {str(e)}")
-        return None
+def _warm_up():
+    """Do the one-off work of a first request ahead of time.
 
+    Building the converter imports markitdown and all of its converter backends
+    (pdfminer, mammoth, BeautifulSoup, ...), which otherwise happens on the first fetch.
+    """
+    get_markitdown()
+    if WARM_HOSTS:
+        warm_connections(WARM_HOSTS)
 
-# ===== MAIN ENTRY POINT ===== #
 
 def main():
     """Main entry point for the application.
 
     Handles command-line arguments to either:
-    1. Run in test mode with a specific URL
+    1. Run in test mode with one URL, or several URLs fetched concurrently
     2. Start the MCP server with stdio transport
     """
     import sys
 
+    configure_logging()
+
+    # Check Ollama availability at startup
+    log_info("Checking Ollama availability...")
+    check_ollama_availability()
+
     # Check if URL is provided as command line argument for testing
     if len(sys.argv) > 1 and sys.argv[1] == "--test":
-        if len(sys.argv) > 2:
+        if len(sys.argv) > 3:
+            test_markitdown_fetch_batch(sys.argv[2:])
+        elif len(sys.argv) > 2:
             test_url = sys.argv[2]
             test_markitdown_fetch(test_url)
         else:
             log_info("Please provide a URL to test")
-            log_info("Usage: python main.py --test <url>")
+            log_info("Usage: python main.py --test <url> [<url> ...]")
         return
 
     # Start normal MCP server mode
     log_info("Starting MarkItDown Fetch Server")
 
+    # Warm up in the background so startup is not delayed by imports or slow hosts
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+    mcp = create_server()
     transport = DEFAULT_TRANSPORT
     log_info(f"Using {transport} transport mode")
 
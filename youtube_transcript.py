@@ -25,25 +25,38 @@ Usage:
         print(f"Failed: {result['error']}")
 """
 
+import copy
 from functools import lru_cache
+import html
+import json
 import logging
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import os
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from urllib.parse import urlparse, parse_qs
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from itertools import islice
+from itertools import accumulate
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import random
 import humanize
-from bs4 import BeautifulSoup
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import RequestBlocked, YouTubeTranscriptApi
 from youtube_transcript_api.proxies import WebshareProxyConfig, GenericProxyConfig, ProxyConfig
-import yt_dlp
-from yt_dlp.extractor.youtube import YoutubeIE
+
+from caching import LRUCache, SQLiteCache
+
+# yt-dlp is imported lazily (see _yt_dlp) because importing it costs hundreds of
+# milliseconds and it is only needed for metadata lookups and the subtitle fallback.
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -51,7 +64,99 @@ logger = logging.getLogger(__name__)
 # Optional: enable detailed yt-dlp POT tracing via env
 POT_TRACE_ENABLED = str(os.environ.get('YTDLP_POT_TRACE', '')).lower() in ('1', 'true', 'yes', 'on')
 
-def _probe_bgutil(url: str, timeout: float = 1.5) -> bool:
+# Browser User-Agent sent with every request to YouTube
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+
+# Precompiled subtitle filters used when cleaning yt-dlp VTT/SRT output.
+# The header block (WEBVTT, Kind:, Language:, STYLE and NOTE blocks) is everything
+# before the first timing line and is skipped as a whole; within the cues a single
+# search rejects timing lines, caption counters and the word-timed duplicates
+# (e.g. <00:00:00.320><c> I</c>) found in auto-generated captions.
+_VTT_SKIP_RE = re.compile(r'^\d+$|-->|align:start position:|<\d{2}:\d{2}[:.\d]*>')
+# Video ID in the common watch, youtu.be, embed and /v/ URL shapes; anything else goes through urlparse
+_VIDEO_ID_RE = re.compile(
+    r'^https?://(?:(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#]*?&)?v=|embed/|v/)|youtu\.be/)'
+    r'([A-Za-z0-9_-]{11})(?=[&#/?]|$)'
+)
+# A plain language code (en, de, pt-BR) as opposed to a yt-dlp language regex like en.*
+_PLAIN_LANGUAGE_RE = re.compile(r'[A-Za-z]{2,3}(?:-[A-Za-z0-9]+)*')
+# The watch page's <title>; the only part of the page get_video_title needs
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]*)</title>', re.IGNORECASE)
+# Any remaining inline markup (<c>, <i>, <b>, ...) on lines that are kept
+_VTT_TAG_RE = re.compile(r'<[^>]*>')
+# Auto-generated captions repeat each line within a short rolling window, not only adjacently
+_DEDUP_WINDOW = 4
+
+# Successful transcript and metadata lookups per video, so pagination calls and the
+# metadata lookup that accompanies each one do not go back to YouTube; in memory they
+# expire like the copies on disk: transcripts after a week, metadata after a day
+_RESULT_CACHE_SIZE = 64
+_TRANSCRIPT_TTL = 7 * 86400
+_VIDEO_INFO_TTL = 86400
+_TRANSCRIPT_CACHE = LRUCache(_RESULT_CACHE_SIZE, ttl=_TRANSCRIPT_TTL)
+_VIDEO_INFO_CACHE = LRUCache(_RESULT_CACHE_SIZE, ttl=_VIDEO_INFO_TTL)
+_TITLE_CACHE = LRUCache(_RESULT_CACHE_SIZE, ttl=_VIDEO_INFO_TTL)
+
+# The same results persisted across restarts
+_DISK_CACHE = SQLiteCache(
+    os.path.join(
+        os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'mcp-markitdown', 'youtube.sqlite3'
+    ),
+    int(os.environ.get('YOUTUBE_DISK_CACHE_SIZE', '512'))
+)
+# Videos yt-dlp found no subtitles for are remembered for an hour, in case captions get added
+_NO_SUBTITLES_TTL = 3600
+
+# Idle yt-dlp instances for subtitle downloads, pooled per language list, format and bgutil
+# URL (see _subtitle_ydl); each download checks one out, so downloads run concurrently
+_SUBTITLE_YDLS = OrderedDict()
+_SUBTITLE_YDLS_SIZE = 8
+_SUBTITLE_YDL_POOL_SIZE = 4
+_SUBTITLE_YDLS_LOCK = threading.Lock()
+
+# Subtitle files only live for the duration of one call, so they go to a RAM-backed
+# tmpfs where one is available (Linux) and to the regular temp directory otherwise
+_SUBTITLE_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# yt-dlp options every subtitle instance starts from; only the languages, the format and
+# the bgutil provider settings differ between instances
+_SUBTITLE_YDL_OPTS = {
+    'skip_download': True,
+    'writesubtitles': True,
+    'writeautomaticsub': True,
+    'outtmpl': 'subtitle',
+    'quiet': True,  # Keep consistent with class initialization
+    'no_warnings': True,
+    'noplaylist': True,  # Never expand a playlist URL into many extractions
+    'ignore_no_formats_error': True,
+    'http_headers': {
+        'User-Agent': USER_AGENT,
+    },
+    # Minimal extractor args; let yt-dlp choose client; bgutil supplies tokens
+    'extractor_args': {
+        'youtube': {
+            'player_client': ['android', 'ios']
+        }
+    },
+}
+
+# Requests per second sent to YouTube across all threads; batch fetches queue behind this
+_YOUTUBE_REQUESTS_PER_SECOND = float(os.environ.get('YOUTUBE_REQUESTS_PER_SECOND', '5'))
+
+# Comma-separated proxy URLs that requests to YouTube rotate through (see _RotatingProxyAdapter)
+_YOUTUBE_PROXY_POOL = tuple(p.strip() for p in os.environ.get('YOUTUBE_PROXY_POOL', '').split(',') if p.strip())
+# Seconds a proxy is skipped after it is refused, rate limited or unreachable
+_PROXY_COOLOFF = 300
+
+# Longest Retry-After wait the HTTP session honours before retrying a request
+_RETRY_AFTER_CAP = 10.0
+
+# HTTP session and YouTubeTranscriptApi per proxy configuration, shared by every fetcher
+# so keep-alive connections to YouTube are reused across calls
+_HTTP_CLIENTS = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+def _probe_bgutil(url: str, timeout: float = 1.0) -> bool:
     """Return True if a bgutil POT provider responds at url/ping."""
     try:
         resp = requests.get(f"{url.rstrip('/')}/ping", timeout=timeout)
@@ -81,23 +186,37 @@ def _resolve_bgutil_provider_url() -> Optional[str]:
         'http://localhost:4416',
     ])
 
-    seen = set()
-    for url in candidates:
-        if not url or url in seen:
-            continue
-        seen.add(url)
-        if _probe_bgutil(url):
-            return url
-    return None
+    # Probe every candidate at once, so a miss costs one timeout rather than one per
+    # candidate; the first responsive URL in priority order wins
+    unique = list(dict.fromkeys(url for url in candidates if url))
+    executor = ThreadPoolExecutor(max_workers=len(unique))
+    try:
+        probes = [executor.submit(_probe_bgutil, url) for url in unique]
+        for url, probe in zip(unique, probes):
+            if probe.result():
+                return url
+        return None
+    finally:
+        # Do not wait for lower-priority probes once an answer is known
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
+# A provider URL set in the environment is used as-is, without probing
+_BGUTIL_ENV_URL = os.environ.get('YTDLP_BGUTIL_POT_PROVIDER_URL')
+# Seconds a probe result is trusted, so a provider started after the server is still picked up
+_BGUTIL_PROBE_TTL = 300
+_BGUTIL_URL = None
+_BGUTIL_EXPIRES = 0.0
+_BGUTIL_PROBED = False
+_BGUTIL_LOCK = threading.Lock()
 
-# Detect and set bgutil provider URL (enables tokens automatically when available)
-BGUTIL_POT_PROVIDER_URL = _resolve_bgutil_provider_url()
-if BGUTIL_POT_PROVIDER_URL:
-    os.environ['YTDLP_BGUTIL_POT_PROVIDER_URL'] = BGUTIL_POT_PROVIDER_URL
+
+def _enable_bgutil(url: str) -> None:
+    """Export the provider URL for yt-dlp and report whether the bgutil plugin is installed."""
+    os.environ['YTDLP_BGUTIL_POT_PROVIDER_URL'] = url
     # Some setups also look for a generic switch – set if helpful
     os.environ['YTDLP_BGUTIL_PO_PROVIDER'] = 'bgutil'
-    logger.info(f"bgutil POT provider enabled at {BGUTIL_POT_PROVIDER_URL}")
+    logger.info(f"bgutil POT provider enabled at {url}")
     # Check for yt-dlp plugin presence non-intrusively (filesystem-based)
     try:
         import yt_dlp_plugins  # namespace package used by yt-dlp
@@ -114,18 +233,352 @@ if BGUTIL_POT_PROVIDER_URL:
     except Exception:
         # Do not warn; yt-dlp may still load plugins via its loader without importability here
         logger.info("yt_dlp_plugins package not importable; continuing (yt-dlp may still discover plugins)")
-else:
-    logger.info("bgutil POT provider not detected; proceeding without SABR token support")
+
+
+def get_bgutil_provider_url() -> Optional[str]:
+    """Return the bgutil POT provider URL for yt-dlp, or None when no provider is running.
+
+    The provider is looked up on first use instead of at import, so importing this
+    module never waits on network probes. Probe results are reused for
+    _BGUTIL_PROBE_TTL seconds; an explicit YTDLP_BGUTIL_POT_PROVIDER_URL is never probed.
+    """
+    global _BGUTIL_URL, _BGUTIL_EXPIRES, _BGUTIL_PROBED
+    with _BGUTIL_LOCK:
+        now = time.monotonic()
+        if now < _BGUTIL_EXPIRES:
+            return _BGUTIL_URL
+
+        if _BGUTIL_ENV_URL:
+            url = _BGUTIL_ENV_URL
+            _BGUTIL_EXPIRES = float('inf')
+        else:
+            url = _resolve_bgutil_provider_url()
+            _BGUTIL_EXPIRES = now + _BGUTIL_PROBE_TTL
+
+        # Report only changes, not every re-probe
+        if url and url != _BGUTIL_URL:
+            _enable_bgutil(url)
+        elif not url and (_BGUTIL_URL or not _BGUTIL_PROBED):
+            logger.info("bgutil POT provider not detected; proceeding without SABR token support")
+        _BGUTIL_URL = url
+        _BGUTIL_PROBED = True
+        return url
 
 # Note: bgutil-ytdlp-pot-provider plugins are automatically discovered and registered by yt-dlp
 # when installed in the yt_dlp_plugins directory. No manual configuration is needed.
 
 # ===== UTILITY FUNCTIONS ===== #
 
+def _yt_dlp():
+    """Import and return the yt_dlp module on first use."""
+    import yt_dlp
+    return yt_dlp
+
+
+def _disk_cache_get(kind: str, key, ttl: float):
+    """Return the JSON value stored under (kind, key) if younger than ttl seconds, or None."""
+    return _DISK_CACHE.get(_disk_key(kind, key), ttl=ttl)
+
+
+def _disk_cache_put(kind: str, key, value) -> None:
+    """Store a JSON-serializable value under (kind, key)."""
+    _DISK_CACHE.set(_disk_key(kind, key), value)
+
+
+def _disk_key(kind: str, key) -> tuple:
+    """Return the on-disk key for key: kind followed by the key's items, so deleting by video ID prefix works."""
+    return (kind, *key) if isinstance(key, tuple) else (kind, key)
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry whose Retry-After waits are capped at _RETRY_AFTER_CAP seconds."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_CAP)
+
+
+class _RotatingProxyAdapter(HTTPAdapter):
+    """HTTPAdapter that sends each request through the next proxy of a pool.
+
+    A proxy that answers 407 or 429, or cannot be reached, is skipped for
+    _PROXY_COOLOFF seconds so load moves to the others, and the request is
+    resent through the next proxy that is not cooling off.
+    """
+
+    def __init__(self, proxies: Tuple[str, ...], **kwargs):
+        super().__init__(**kwargs)
+        self._proxies = deque(proxies)
+        self._blocked_until = {}
+        self._proxy_lock = threading.Lock()
+
+    def _next_proxy(self, available_only: bool = False) -> Optional[str]:
+        """Return the next proxy that is not cooling off, or the one that recovers soonest.
+
+        With available_only, None is returned instead when every proxy is cooling off.
+        """
+        with self._proxy_lock:
+            now = time.monotonic()
+            for _ in range(len(self._proxies)):
+                proxy = self._proxies[0]
+                self._proxies.rotate(-1)
+                if self._blocked_until.get(proxy, 0.0) <= now:
+                    return proxy
+            if available_only:
+                return None
+            return min(self._proxies, key=lambda p: self._blocked_until[p])
+
+    def _block(self, proxy: str) -> None:
+        """Take a proxy out of rotation for _PROXY_COOLOFF seconds."""
+        # Logged without its userinfo, which holds the proxy credentials
+        parsed = urlparse(proxy)
+        shown = parsed._replace(netloc=parsed.netloc.rpartition('@')[2]).geturl()
+        logger.warning(f"Proxy {shown} refused or rate limited a request; skipping it for {_PROXY_COOLOFF}s")
+        with self._proxy_lock:
+            self._blocked_until[proxy] = time.monotonic() + _PROXY_COOLOFF
+
+    def send(self, request, **kwargs):
+        # A request a proxy refused or rate limited is resent through the next proxy that
+        # is not cooling off, so the retry never goes back through the proxy that said no
+        proxy = self._next_proxy()
+        while True:
+            kwargs['proxies'] = {'http': proxy, 'https': proxy}
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.exceptions.ProxyError, requests.exceptions.ConnectTimeout):
+                self._block(proxy)
+                proxy = self._next_proxy(available_only=True)
+                if proxy is None:
+                    raise
+                continue
+            if response.status_code not in (407, 429):
+                return response
+            self._block(proxy)
+            proxy = self._next_proxy(available_only=True)
+            if proxy is None:
+                return response
+            response.close()
+
+
+def _http_clients(
+    webshare_username: Optional[str],
+    webshare_password: Optional[str],
+    http_proxy: Optional[str],
+    https_proxy: Optional[str],
+    proxy_pool: Tuple[str, ...] = ()
+) -> Tuple[requests.Session, YouTubeTranscriptApi, Optional[ProxyConfig]]:
+    """Return the shared session, transcript API client and proxy config for these proxy settings.
+
+    YouTubeTranscriptApi applies its proxy configuration to the session it is
+    given, so each distinct configuration gets its own session. A proxy pool is
+    only used when no Webshare or HTTP(S) proxy is configured.
+    """
+    key = (webshare_username, webshare_password, http_proxy, https_proxy, proxy_pool)
+    with _HTTP_CLIENTS_LOCK:
+        clients = _HTTP_CLIENTS.get(key)
+        if clients is None:
+            session = requests.Session()
+
+            # Set a realistic User-Agent
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'Referer': 'https://www.google.com/'
+            })
+            # Configure proxy if provided
+            proxy_config = None
+            if webshare_username and webshare_password:
+                proxy_config = WebshareProxyConfig(webshare_username, webshare_password)
+            elif http_proxy or https_proxy:
+                proxy_config = GenericProxyConfig(http_proxy, https_proxy)
+
+            # The only retry layer: rate limiting and transient server errors are retried
+            # here, honouring Retry-After up to _RETRY_AFTER_CAP seconds
+            status_forcelist = (429, 500, 502, 503, 504)
+            if proxy_pool and proxy_config is None:
+                # Retries inside urllib3 reuse the same proxy, so a 429 is left to the
+                # rotating adapter, which takes that proxy out and sends the next request elsewhere
+                status_forcelist = (500, 502, 503, 504)
+            adapter_args = dict(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=_CappedRetry(total=3, backoff_factor=0.5, status_forcelist=status_forcelist, raise_on_status=False)
+            )
+            if proxy_pool and proxy_config is None:
+                adapter = _RotatingProxyAdapter(proxy_pool, **adapter_args)
+                session.mount("http://", adapter)
+            else:
+                adapter = HTTPAdapter(**adapter_args)
+            session.mount("https://", adapter)
+
+            # Initialize YouTubeTranscriptApi with http_client like mcp-youtube-transcript does
+            ytt_api = YouTubeTranscriptApi(http_client=session, proxy_config=proxy_config)
+            clients = _HTTP_CLIENTS[key] = (session, ytt_api, proxy_config)
+        return clients
+
+
+class _RateLimiter:
+    """Token bucket shared by every thread: rate acquisitions per second, in bursts of up to burst.
+
+    The rate adapts to the server: slow_down() halves it after a rate-limit response,
+    and it climbs back linearly to the configured maximum over recovery seconds.
+    """
+
+    def __init__(self, rate: float, burst: int, recovery: float = 60.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.recovery = recovery
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        if self.max_rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self.rate = min(self.max_rate, self.rate + elapsed * self.max_rate / self.recovery)
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self) -> None:
+        """Halve the rate (down to a sixteenth of the maximum) after YouTube signals rate limiting."""
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+            logger.info(f"YouTube rate limited the last request; slowing to {self.rate:.2f} requests/s")
+
+
+_YOUTUBE_RATE_LIMITER = _RateLimiter(_YOUTUBE_REQUESTS_PER_SECOND, burst=max(1, int(_YOUTUBE_REQUESTS_PER_SECOND)))
+
+
+def _subtitle_files(subtitle_dir: str) -> List[str]:
+    """Return the paths of the subtitle files yt-dlp wrote into subtitle_dir, json3 first.
+
+    The directory belongs to a single call, so everything in it came from yt-dlp
+    and no name matching against unrelated files is needed.
+    """
+    extensions = ('.json3', '.vtt', '.srt')
+    with os.scandir(subtitle_dir) as entries:
+        paths = [entry.path for entry in entries if entry.name.endswith(extensions)]
+    return sorted(paths, key=lambda path: (extensions.index(os.path.splitext(path)[1]), path))
+
+
+def _preferred_subtitle(subtitle_files: List[str], languages: List[str]) -> Tuple[str, str]:
+    """Return the path and language code of the best subtitle file for languages.
+
+    yt-dlp names the files <template>.<lang>.<ext> and treats each entry of
+    languages as a regex, so the files are matched the same way, in order of
+    preference. Falls back to the first file when none matches.
+    """
+    # Each file's language is parsed out of its name once, not once per pattern
+    candidates = [(path, os.path.basename(path).rsplit('.', 2)[-2]) for path in subtitle_files]
+    for pattern in languages:
+        for path, language in candidates:
+            if re.fullmatch(pattern, language):
+                return path, language
+    return candidates[0]
+
+
+def _json3_lines(path: str) -> List[str]:
+    """Return the caption text of a YouTube json3 subtitle file, one line per caption event.
+
+    json3 carries each caption once as text segments, so unlike VTT there are no
+    timing lines, markup or rolling duplicates to filter out.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return _json3_text(json.load(f))
+
+
+def _vtt_lines(path: str) -> List[str]:
+    """Return the caption text of a VTT/SRT subtitle file, one line per kept caption line.
+
+    The header block is skipped, then timing lines, counters and word-timed lines,
+    leftover inline markup is stripped, and a line repeating one of the last few
+    kept lines (as auto-generated captions do) is dropped. Lines are streamed from
+    the file, so the raw subtitle text is never held in memory.
+    """
+    lines = []
+    recent_lines = deque(maxlen=_DEDUP_WINDOW)
+    in_header = True
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped_line = line.strip()
+            if in_header:
+                # Caption text only ever follows a timing line
+                in_header = '-->' not in stripped_line
+                continue
+            if not stripped_line or _VTT_SKIP_RE.search(stripped_line):
+                continue
+            # Drop any leftover inline markup from the caption text
+            if '<' in stripped_line:
+                stripped_line = _VTT_TAG_RE.sub('', stripped_line).strip()
+                if not stripped_line:
+                    continue
+            # YouTube captions often repeat lines due to timing adjustments
+            dedup_key = stripped_line.casefold()
+            if dedup_key not in recent_lines:
+                lines.append(stripped_line)
+                recent_lines.append(dedup_key)
+    return lines
+
+
+def _json3_text(data: Dict[str, Any]) -> List[str]:
+    """Return the caption text of parsed json3 subtitle data, one line per caption event."""
+    lines = []
+    for event in data.get('events', ()):
+        segs = event.get('segs')
+        if not segs:
+            continue
+        # Collapse the line breaks of two-line captions into single spaces
+        text = ' '.join(''.join(seg.get('utf8', '') for seg in segs).split())
+        if text:
+            lines.append(text)
+    return lines
+
+
+def _timedtext_lines(session: requests.Session, video_id: str, language: str) -> List[str]:
+    """Fetch a video's captions straight from YouTube's timedtext endpoint as json3.
+
+    One GET replaces a whole yt-dlp extraction when YouTube serves the track
+    unsigned. Returns an empty list when it does not (an empty body, an HTTP
+    error or invalid JSON), so the caller can fall back to yt-dlp.
+    """
+    try:
+        _YOUTUBE_RATE_LIMITER.acquire()
+        response = session.get(
+            "https://www.youtube.com/api/timedtext",
+            params={"v": video_id, "lang": language, "fmt": "json3"},
+            timeout=5
+        )
+        if response.status_code == 429:
+            _YOUTUBE_RATE_LIMITER.slow_down()
+        if response.status_code != 200 or not response.content:
+            return []
+        return _json3_text(response.json())
+    except (requests.RequestException, ValueError) as e:
+        logger.debug(f"timedtext request failed for {video_id}: {e}")
+        return []
+
+
+@lru_cache(maxsize=1024)
 def extract_video_id(url: str) -> str:
     """Extract the YouTube video ID from various URL formats.
 
     Supports standard youtube.com URLs, youtu.be short URLs, and embed URLs.
+    Results are memoized, since the same URL is parsed by several callers per request.
+    Well-formed URLs are matched with a single regex; others are parsed in full.
 
     Args:
         url: YouTube URL in any supported format
@@ -136,6 +589,10 @@ def extract_video_id(url: str) -> str:
     Raises:
         ValueError: If the video ID cannot be extracted from the URL
     """
+    match = _VIDEO_ID_RE.match(url)
+    if match:
+        return match.group(1)
+
     parsed_url = urlparse(url)
 
     # Handle youtu.be URLs
@@ -160,27 +617,64 @@ def extract_video_id(url: str) -> str:
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
 
-def get_video_title(session: requests.Session, video_id: str, languages: List[str]) -> str:
-    """Get the title of a YouTube video."""
+def _resolve_video_id(url: str) -> str:
+    """Return the video ID for a YouTube URL, or url itself if it already is a video ID.
+
+    Raises:
+        ValueError: If url is neither a YouTube video URL nor an 11-character video ID
+    """
     try:
-        # Add slight delay to avoid rate limiting
-        time.sleep(random.uniform(0.5, 1.5))
+        return extract_video_id(url)
+    except ValueError:
+        # If extraction fails, assume the input is already a video ID
+        if not url.isalnum() or len(url) != 11:
+            raise ValueError(f"Invalid YouTube video URL or ID: {url}")
+        return url
+
 
+def _title_languages(languages: List[str]) -> List[str]:
+    """Return the plain language codes among yt-dlp subtitle languages, for get_video_title.
+
+    Regexes such as en.* are not valid Accept-Language values, so they are left out;
+    English is used when no plain code remains.
+    """
+    return [language for language in languages if _PLAIN_LANGUAGE_RE.fullmatch(language)] or ["en"]
+
+
+def get_video_title(session: requests.Session, video_id: str, languages: List[str]) -> str:
+    """Get the title of a YouTube video.
+
+    Titles scraped from the watch page are cached per video ID and language list,
+    since the languages are sent as Accept-Language and YouTube localizes titles,
+    so the page is fetched at most once per video and languages while the entry
+    stays in the cache.
+    """
+    cache_key = (video_id, tuple(languages))
+    cached = _TITLE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        # Throttled with the transcript requests instead of a fixed delay per call
+        _YOUTUBE_RATE_LIMITER.acquire()
         response = session.get(
             f"https://www.youtube.com/watch?v={video_id}",
             headers={
                 "Accept-Language": ",".join(languages),
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+                "User-Agent": USER_AGENT
             }
         )
+        if response.status_code == 429:
+            _YOUTUBE_RATE_LIMITER.slow_down()
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        if soup.title and soup.title.string:
-            title = soup.title.string
+        match = _TITLE_RE.search(response.text)
+        if match and match.group(1).strip():
+            title = html.unescape(match.group(1).strip())
             # Remove " - YouTube" suffix if present
             if " - YouTube" in title:
                 title = title.replace(" - YouTube", "")
+            _TITLE_CACHE.set(cache_key, title)
             return title
     except Exception as e:
         logger.warning(f"Failed to get video title: {e}")
@@ -188,6 +682,60 @@ def get_video_title(session: requests.Session, video_id: str, languages: List[st
     return "Unknown Title"
 
 
+def _build_subtitle_ydl(languages: Tuple[str, ...], subtitlesformat: str, bgutil_url: Optional[str]):
+    """Build a yt-dlp instance for subtitle downloads with these options."""
+    ydl_opts = copy.deepcopy(_SUBTITLE_YDL_OPTS)
+    ydl_opts['subtitleslangs'] = list(languages)
+    ydl_opts['subtitlesformat'] = subtitlesformat
+
+    # Configure bgutil POT provider parameters if available
+    if bgutil_url:
+        logger.info("Using bgutil POT provider at %s", bgutil_url)
+        # Select provider and set base_url for plugin
+        ydl_opts['extractor_args']['youtube']['pot_provider'] = ['bgutil:http']
+        ydl_opts['extractor_args'].setdefault('youtubepot-bgutilhttp', {})['base_url'] = [bgutil_url]
+        if POT_TRACE_ENABLED:
+            ydl_opts['extractor_args']['youtube']['pot_trace'] = ['true']
+
+    # bgutil plugins are automatically discovered by yt-dlp if installed
+    yt_dlp = _yt_dlp()
+    from yt_dlp.extractor.youtube import YoutubeIE
+    ydl = yt_dlp.YoutubeDL(params=ydl_opts, auto_init=False)
+    ydl.add_info_extractor(YoutubeIE())
+    return ydl
+
+
+@contextmanager
+def _subtitle_ydl(languages: Tuple[str, ...] = ('en',), subtitlesformat: str = 'vtt'):
+    """Check out a pooled yt-dlp instance for these subtitle options for one download.
+
+    Building a YoutubeDL parses its options and sets up extractors, and its YouTube
+    extractor keeps the player data and PO tokens it fetched, so instances are reused
+    across downloads. Each is used by one download at a time, since downloads mutate
+    its state, and concurrent downloads get instances of their own; output goes to
+    params['paths']['home'], which callers set per download.
+    """
+    # Resolved before any lock is taken; a provider appearing or going away gives a new
+    # pool key, since its URL is part of the options, and the old pool ages out
+    bgutil_url = get_bgutil_provider_url()
+    key = (tuple(languages), subtitlesformat, bgutil_url)
+    with _SUBTITLE_YDLS_LOCK:
+        idle = _SUBTITLE_YDLS.get(key)
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        ydl = _build_subtitle_ydl(tuple(languages), subtitlesformat, bgutil_url)
+    try:
+        yield ydl
+    finally:
+        with _SUBTITLE_YDLS_LOCK:
+            idle = _SUBTITLE_YDLS.setdefault(key, [])
+            if len(idle) < _SUBTITLE_YDL_POOL_SIZE:
+                idle.append(ydl)
+            _SUBTITLE_YDLS.move_to_end(key)
+            while len(_SUBTITLE_YDLS) > _SUBTITLE_YDLS_SIZE:
+                _SUBTITLE_YDLS.popitem(last=False)
+
+
 class VideoInfo:
     """Class to hold video information metadata."""
 
@@ -232,7 +780,8 @@ class YouTubeTranscriptFetcher:
         webshare_password: Optional[str] = None,
         http_proxy: Optional[str] = None,
         https_proxy: Optional[str] = None,
-        response_limit: int = -1
+        response_limit: int = -1,
+        proxy_pool: Optional[List[str]] = None
     ):
         """Initialize the transcript fetcher with optional proxy configuration.
 
@@ -242,49 +791,48 @@ class YouTubeTranscriptFetcher:
             http_proxy: HTTP proxy URL
             https_proxy: HTTPS proxy URL
             response_limit: Maximum number of characters for paginated responses (-1 for no pagination)
+            proxy_pool: Proxy URLs to rotate requests through when no other proxy is configured
+                (defaults to YOUTUBE_PROXY_POOL)
         """
-        self.session = requests.Session()
         self.response_limit = response_limit
 
-        # Set a realistic User-Agent
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Referer': 'https://www.google.com/'
-        })
-
-        # Configure proxy if provided
-        self.proxy_config = None
-        if webshare_username and webshare_password:
-            self.proxy_config = WebshareProxyConfig(webshare_username, webshare_password)
-        elif http_proxy or https_proxy:
-            self.proxy_config = GenericProxyConfig(http_proxy, https_proxy)
-
-        # Initialize YouTubeTranscriptApi with http_client like mcp-youtube-transcript does
-        self.ytt_api = YouTubeTranscriptApi(http_client=self.session, proxy_config=self.proxy_config)
-
-        # Initialize yt-dlp for video info
-        # Configure yt-dlp with bgutil provider URL if available
-        ydl_params = {"quiet": True}
-
-        if BGUTIL_POT_PROVIDER_URL:
-            logger.info(f"Initializing YoutubeDL with bgutil POT provider at {BGUTIL_POT_PROVIDER_URL}")
-            ydl_params["extractor_args"] = {
-                # Select the provider
-                "youtube": {
-                    "pot_provider": ["bgutil:http"],
-                },
-                # Configure provider-specific base_url
-                "youtubepot-bgutilhttp": {
-                    "base_url": [BGUTIL_POT_PROVIDER_URL],
-                },
-            }
-            if POT_TRACE_ENABLED:
-                ydl_params["extractor_args"]["youtube"]["pot_trace"] = ["true"]
+        # Reuse the connection pool of every other fetcher with the same proxy settings
+        pool = tuple(proxy_pool) if proxy_pool is not None else _YOUTUBE_PROXY_POOL
+        self.session, self.ytt_api, self.proxy_config = _http_clients(
+            webshare_username, webshare_password, http_proxy, https_proxy, pool
+        )
+
+        # yt-dlp instance for video info, built on first use (see the ydl property)
+        self._ydl = None
+
+    @property
+    def ydl(self):
+        """yt-dlp instance used for metadata extraction, created on first use."""
+        if self._ydl is None:
+            # Configure yt-dlp with bgutil provider URL if available
+            ydl_params = {"quiet": True}
+
+            bgutil_url = get_bgutil_provider_url()
+            if bgutil_url:
+                logger.info(f"Initializing YoutubeDL with bgutil POT provider at {bgutil_url}")
+                ydl_params["extractor_args"] = {
+                    # Select the provider
+                    "youtube": {
+                        "pot_provider": ["bgutil:http"],
+                    },
+                    # Configure provider-specific base_url
+                    "youtubepot-bgutilhttp": {
+                        "base_url": [bgutil_url],
+                    },
+                }
+                if POT_TRACE_ENABLED:
+                    ydl_params["extractor_args"]["youtube"]["pot_trace"] = ["true"]
 
-        self.ydl = yt_dlp.YoutubeDL(params=ydl_params, auto_init=False)
-        self.ydl.add_info_extractor(YoutubeIE())
+            yt_dlp = _yt_dlp()
+            from yt_dlp.extractor.youtube import YoutubeIE
+            self._ydl = yt_dlp.YoutubeDL(params=ydl_params, auto_init=False)
+            self._ydl.add_info_extractor(YoutubeIE())
+        return self._ydl
 
     def get_transcript(
         self,
@@ -292,7 +840,8 @@ class YouTubeTranscriptFetcher:
         language: str = "en",
         with_timestamps: bool = False,
         max_retries: int = 3,
-        next_cursor: Optional[str] = None
+        next_cursor: Optional[str] = None,
+        include_title: bool = True
     ) -> Dict[str, Any]:
         """
         Get the transcript for a YouTube video.
@@ -301,83 +850,108 @@ class YouTubeTranscriptFetcher:
             url: YouTube video URL or ID
             language: Preferred language code (defaults to English)
             with_timestamps: Whether to include timestamps in the output
-            max_retries: Maximum number of retries if fetching fails
+            max_retries: Kept for compatibility; failed requests are retried by the shared
+                HTTP session, not per transcript
             next_cursor: Cursor for pagination (if response_limit is set)
+            include_title: Look up the video title; when False the result's title is None
+                and no request is made for it
 
         Returns:
             Dictionary with transcript information including pagination cursor if needed
         """
-        # Try to extract video ID from URL
-        try:
-            video_id = extract_video_id(url)
-        except ValueError:
-            # If extraction fails, assume the input is already a video ID
-            if not url.isalnum() or len(url) != 11:
-                raise ValueError(f"Invalid YouTube video URL or ID: {url}")
-            video_id = url
-
+        video_id = _resolve_video_id(url)
         # Set up language preferences with fallback
         languages = [language] if language == "en" else [language, "en"]
 
+        entry, title, last_error = self._load_transcript(video_id, languages, language, with_timestamps, include_title)
+        if entry is not None:
+            return self._transcript_result(entry, video_id, next_cursor)
+
+        # If all methods failed
+        return {
+            "title": title,
+            "transcript": "",
+            "language": None,
+            "success": False,
+            "error": last_error,
+            "video_id": video_id
+        }
+
+    def iter_transcript(self, url: str, language: str = "en", with_timestamps: bool = False) -> Iterator[str]:
+        """Yield every line of a video's transcript, ignoring response_limit.
+
+        Shares get_transcript's fetching, fallback and caching, but never joins the
+        lines into one string, so streaming consumers can forward them as they go.
+
+        Args:
+            url: YouTube video URL or ID
+            language: Preferred language code (defaults to English)
+            with_timestamps: Whether to prefix each line with its start time
+
+        Yields:
+            Transcript lines in order
+
+        Raises:
+            ValueError: If the URL is not a YouTube video
+            RuntimeError: If no transcript could be retrieved
+        """
+        video_id = _resolve_video_id(url)
+        languages = [language] if language == "en" else [language, "en"]
+        entry, _, last_error = self._load_transcript(video_id, languages, language, with_timestamps, False)
+        if entry is None:
+            raise RuntimeError(f"Could not retrieve transcript for {video_id}: {last_error}")
+        yield from entry["lines"]
+
+    def _load_transcript(
+        self,
+        video_id: str,
+        languages: List[str],
+        language: str,
+        with_timestamps: bool,
+        include_title: bool
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Return a video's transcript entry from the caches, the transcript API or yt-dlp.
+
+        Returns:
+            Tuple of the entry (title, lines, language and method keys; None if every
+            method failed), the video title, and the error message on failure
+        """
+        # Pagination calls for a video fetched recently are sliced from the cached transcript
+        cache_key = (video_id, language, with_timestamps)
+        cached = _TRANSCRIPT_CACHE.get(cache_key)
+        if cached is None:
+            cached = _disk_cache_get('transcript', cache_key, _TRANSCRIPT_TTL)
+            if cached is not None:
+                _TRANSCRIPT_CACHE.set(cache_key, cached)
+        if cached is not None:
+            logger.info(f"Using cached transcript for {video_id}")
+            if include_title and cached["title"] is None:
+                cached = {**cached, "title": self._video_title(video_id, languages)}
+                _TRANSCRIPT_CACHE.set(cache_key, cached)
+            return cached, cached["title"], None
+
         # Get the video title
-        title = get_video_title(self.session, video_id, languages)
+        title = self._video_title(video_id, languages) if include_title else None
 
-        # Try to get the transcript with pagination support - simplified approach like mcp-youtube-transcript
+        # Try to get the transcript - simplified approach like mcp-youtube-transcript
         try:
             # Use the instance method like mcp-youtube-transcript does
-            raw_transcript = self.ytt_api.fetch(video_id, languages=languages)
+            raw_transcript = self._fetch_transcript(video_id, languages)
 
             # Store the transcript language (default to first requested language)
-            transcript_lang = languages[0]
+            transcript_lang = getattr(raw_transcript, "language_code", None) or languages[0]
 
             # Format the transcript data
+            # fetch() yields snippet objects with text/start/duration attributes (not dicts)
             if with_timestamps:
-                transcript_list = [f"[{item['start']:.1f}s] {item['text']}" for item in raw_transcript]
+                transcript_list = [f"[{snippet.start:.1f}s] {snippet.text}" for snippet in raw_transcript]
             else:
-                transcript_list = [item['text'] for item in raw_transcript]
+                transcript_list = [snippet.text for snippet in raw_transcript]
 
-            # Handle pagination if response limit is set
-            if self.response_limit > 0:
-                # Parse the cursor as integer with fallback
-                try:
-                    cursor_idx = int(next_cursor) if next_cursor else 0
-                except (ValueError, TypeError):
-                    cursor_idx = 0
-
-                # Get the subset of transcript lines based on cursor
-                result = ""
-                next_cursor_out = None
-                for i, line in islice(enumerate(transcript_list), cursor_idx, None):
-                    if line is None:
-                        continue
-                    if len(result) + len(line) + 1 > self.response_limit:
-                        next_cursor_out = str(i)
-                        break
-                    result += f"{line}\n"
-
-                # Remove trailing newline
-                if result:
-                    result = result[:-1]
-
-                # Return the paginated result
-                return {
-                    "title": title,
-                    "transcript": result,
-                    "language": transcript_lang,
-                    "success": True,
-                    "video_id": video_id,
-                    "next_cursor": next_cursor_out
-                }
-            else:
-                # Return the full transcript without pagination
-                return {
-                    "title": title,
-                    "transcript": "\n".join(transcript_list),
-                    "language": transcript_lang,
-                    "success": True,
-                    "video_id": video_id,
-                    "next_cursor": None
-                }
+            entry = {"title": title, "lines": transcript_list, "language": transcript_lang, "method": None}
+            _TRANSCRIPT_CACHE.set(cache_key, entry)
+            _disk_cache_put('transcript', cache_key, entry)
+            return entry, title, None
 
         except Exception as e:
             logger.error(f"Error fetching transcript with youtube-transcript-api: {e}")
@@ -387,153 +961,129 @@ class YouTubeTranscriptFetcher:
         logger.info(f"youtube-transcript-api failed, trying yt-dlp fallback...")
         try:
             # Try the yt-dlp fallback method
+            _YOUTUBE_RATE_LIMITER.acquire()
             transcript_text = self._get_transcript_via_ytdlp(video_id)
             logger.info(f"yt-dlp returned transcript length: {len(transcript_text) if transcript_text else 0}")
             if transcript_text:
-                # Handle pagination if needed
-                if self.response_limit > 0:
-                    lines = transcript_text.split('\n')
-
-                    # Parse the cursor as integer with fallback
-                    try:
-                        cursor_idx = int(next_cursor) if next_cursor else 0
-                    except (ValueError, TypeError):
-                        cursor_idx = 0
-
-                    # Get the subset of transcript lines based on cursor
-                    result = ""
-                    next_cursor_out = None
-                    for i, line in islice(enumerate(lines), cursor_idx, None):
-                        if line is None:
-                            continue
-                        if len(result) + len(line) + 1 > self.response_limit:
-                            next_cursor_out = str(i)
-                            break
-                        result += f"{line}\n"
-
-                    # Remove trailing newline
-                    if result:
-                        result = result[:-1]
-
-                    return {
-                        "title": title,
-                        "transcript": result,
-                        "language": "auto",
-                        "success": True,
-                        "video_id": video_id,
-                        "method": "yt-dlp",
-                        "next_cursor": next_cursor_out
-                    }
-                else:
-                    # Return the full transcript without pagination
-                    return {
-                        "title": title,
-                        "transcript": transcript_text,
-                        "language": "auto",
-                        "success": True,
-                        "video_id": video_id,
-                        "method": "yt-dlp",
-                        "next_cursor": None
-                    }
+                entry = {"title": title, "lines": transcript_text.split('\n'), "language": "auto", "method": "yt-dlp"}
+                _TRANSCRIPT_CACHE.set(cache_key, entry)
+                _disk_cache_put('transcript', cache_key, entry)
+                return entry, title, None
         except Exception as e:
             logger.warning(f"yt-dlp fallback also failed: {e}")
             last_error = f"{last_error}; yt-dlp fallback: {str(e)}"
 
-        # If all methods failed
-        return {
-            "title": title,
-            "transcript": "",
-            "language": None,
-            "success": False,
-            "error": last_error,
-            "video_id": video_id
+        return None, title, last_error
+
+    def _fetch_transcript(self, video_id: str, languages: List[str]):
+        """Fetch a transcript with youtube-transcript-api in a single attempt.
+
+        Rate limiting and transient failures are already retried by the shared HTTP
+        session, so nothing is retried here. A blocked request (an IP block or a 429
+        that outlasted the session's retries) slows the shared limiter and is raised
+        straight away, so the caller can move on to the yt-dlp fallback.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Language codes in order of preference
+
+        Returns:
+            The FetchedTranscript from youtube-transcript-api
+        """
+        _YOUTUBE_RATE_LIMITER.acquire()
+        try:
+            return self.ytt_api.fetch(video_id, languages=languages)
+        except RequestBlocked:
+            _YOUTUBE_RATE_LIMITER.slow_down()
+            raise
+
+    def _video_title(self, video_id: str, languages: List[str]) -> str:
+        """Return the video title, taken from get_video_info's cache when it has already run."""
+        info = _VIDEO_INFO_CACHE.get(video_id)
+        if info is not None:
+            return info["title"]
+        return get_video_title(self.session, video_id, languages)
+
+    def _transcript_result(self, entry: Dict[str, Any], video_id: str, next_cursor: Optional[str]) -> Dict[str, Any]:
+        """Build the get_transcript result for a fetched transcript, paginated if response_limit is set.
+
+        Args:
+            entry: Fetched transcript with title, lines, language and method keys; the
+                line offsets used for pagination are added to it on first use
+            video_id: YouTube video ID
+            next_cursor: Cursor (line index) to resume from
+
+        Returns:
+            Dictionary with transcript information including pagination cursor if needed
+        """
+        lines = entry["lines"]
+
+        # Handle pagination if response limit is set
+        if self.response_limit > 0:
+            # Parse the cursor as integer with fallback
+            try:
+                cursor_idx = int(next_cursor) if next_cursor else 0
+            except (ValueError, TypeError):
+                cursor_idx = 0
+
+            cursor_idx = min(max(cursor_idx, 0), len(lines))
+
+            # offsets[i] is the length of lines[:i] joined with newlines (plus one); computed
+            # once per transcript, so each page end is found by binary search instead of a scan
+            offsets = entry.get("offsets")
+            if offsets is None:
+                offsets = entry["offsets"] = [0, *accumulate(len(line) + 1 for line in lines)]
+
+            # The page is every line that fits within response_limit, counting one newline per line;
+            # a line longer than the limit still gets a page of its own so the cursor always advances
+            end_idx = bisect_right(offsets, offsets[cursor_idx] + self.response_limit) - 1
+            end_idx = min(max(end_idx, cursor_idx + 1), len(lines))
+            next_cursor_out = str(end_idx) if end_idx < len(lines) else None
+            transcript = "\n".join(lines[cursor_idx:end_idx])
+        else:
+            # Return the full transcript without pagination
+            transcript = "\n".join(lines)
+            next_cursor_out = None
+
+        result = {
+            "title": entry["title"],
+            "transcript": transcript,
+            "language": entry["language"],
+            "success": True,
+            "video_id": video_id,
+            "next_cursor": next_cursor_out
         }
+        if entry["method"]:
+            result["method"] = entry["method"]
+        return result
 
     def _get_transcript_via_ytdlp(self, video_id: str) -> str:
         """Try to get transcript using yt-dlp as a fallback method."""
         url = f"https://www.youtube.com/watch?v={video_id}"
 
-        # Create a temporary file for the subtitle
-        with tempfile.NamedTemporaryFile(suffix='.vtt', delete=False) as temp_file:
-            subtitle_path = temp_file.name
+        # yt-dlp writes the subtitles into a directory of their own, so whatever it
+        # wrote is the directory's contents and one rmtree cleans it all up
+        subtitle_dir = tempfile.mkdtemp(prefix='yt-subs-', dir=_SUBTITLE_TMP_DIR)
 
         try:
-            # Configure yt-dlp options - create fresh instance to avoid conflicts
-            ydl_opts = {
-                'skip_download': True,
-                'writesubtitles': True,
-                'writeautomaticsub': True,
-                'subtitleslangs': ['en'],
-                'subtitlesformat': 'vtt',
-                'outtmpl': subtitle_path.replace('.vtt', ''),
-                'quiet': True,  # Keep consistent with class initialization
-                'ignore_no_formats_error': True,
-                'http_headers': {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                },
-                # Minimal extractor args; let yt-dlp choose client; bgutil supplies tokens
-                'extractor_args': {
-                    'youtube': {
-                        'player_client': ['android', 'ios']
-                    }
-                },
-            }
-
-            # Configure bgutil POT provider parameters if available
-            if BGUTIL_POT_PROVIDER_URL:
-                logger.info(f"Using bgutil POT provider at {BGUTIL_POT_PROVIDER_URL}")
-                # Select provider and set base_url for plugin
-                ydl_opts['extractor_args']['youtube']['pot_provider'] = ['bgutil:http']
-                ydl_opts['extractor_args'].setdefault('youtubepot-bgutilhttp', {})['base_url'] = [BGUTIL_POT_PROVIDER_URL]
-                if POT_TRACE_ENABLED:
-                    ydl_opts['extractor_args']['youtube']['pot_trace'] = ['true']
-
-            # bgutil plugins are automatically discovered by yt-dlp if installed
-
-            # Run yt-dlp to download subtitles
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Run yt-dlp to download subtitles into this call's directory
+            with _subtitle_ydl() as ydl:
+                ydl.params['paths'] = {'home': subtitle_dir}
                 ydl.download([url])
 
             # Check for subtitle files
-            base_path = subtitle_path.replace('.vtt', '')
-            subtitle_files = [f for f in os.listdir(os.path.dirname(base_path))
-                             if os.path.isfile(os.path.join(os.path.dirname(base_path), f))
-                             and f.startswith(os.path.basename(base_path))
-                             and (f.endswith('.vtt') or f.endswith('.srt'))]
+            with os.scandir(subtitle_dir) as entries:
+                subtitle_files = sorted(
+                    entry.path for entry in entries
+                    if entry.is_file() and entry.name.endswith(('.vtt', '.srt'))
+                )
 
             if subtitle_files:
                 # Use the first subtitle file found
-                sub_file_path = os.path.join(os.path.dirname(base_path), subtitle_files[0])
-                with open(sub_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                sub_file_path = subtitle_files[0]
 
                 # Process the VTT/SRT file to extract just the text
-                # This is a simple approach - for production use, consider a proper VTT/SRT parser
-                lines = []
-                prev_line = None
-                for line in content.split('\n'):
-                    stripped_line = line.strip()
-                    # Skip timing lines, metadata, and empty lines
-                    if ('-->' in line or                         # Timing information
-                        stripped_line.isdigit() or               # Caption numbers
-                        line.startswith('WEBVTT') or             # VTT header
-                        line.startswith('Kind:') or              # VTT metadata
-                        line.startswith('Language:') or          # VTT metadata
-                        'align:start position:' in line or       # Positioning info
-                        not stripped_line):                      # Empty lines
-                        continue
-                    # Also skip lines that are just HTML/XML tags with timing info like <00:00:00.320><c> I</c>
-                    # These are common in YouTube's auto-generated captions
-                    if '<' in stripped_line and '>' in stripped_line and ':' in stripped_line:
-                        continue
-
-                    # Deduplicate: skip if this line is identical to the previous line
-                    # YouTube captions often have duplicate lines due to timing adjustments
-                    if stripped_line != prev_line:
-                        lines.append(stripped_line)
-                        prev_line = stripped_line
-
-                return '\n'.join(lines)
+                return '\n'.join(_vtt_lines(sub_file_path))
             else:
                 logger.warning("No subtitle files found with yt-dlp")
                 return ""
@@ -541,29 +1091,16 @@ class YouTubeTranscriptFetcher:
             logger.error(f"Error using yt-dlp for transcript: {e}")
             raise
         finally:
-            # Clean up temporary files
-            try:
-                if os.path.exists(subtitle_path):
-                    os.remove(subtitle_path)
-                # Also try to remove any other subtitle files that might have been created
-                base_path = subtitle_path.replace('.vtt', '')
-                for file in os.listdir(os.path.dirname(base_path)):
-                    if file.startswith(os.path.basename(base_path)) and (file.endswith('.vtt') or file.endswith('.srt')):
-                        try:
-                            os.remove(os.path.join(os.path.dirname(base_path), file))
-                        except:
-                            pass
-            except:
-                pass
-
-
-    @lru_cache(maxsize=32)
+            # Clean up the subtitle directory and everything yt-dlp put in it
+            shutil.rmtree(subtitle_dir, ignore_errors=True)
+
+
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """Get detailed information about a YouTube video.
 
         Uses yt-dlp to extract rich metadata about the video including title,
-        uploader, upload date, duration, and description. Results are cached
-        to improve performance for repeated requests.
+        uploader, upload date, duration, and description. Successful lookups are
+        cached per video ID across fetcher instances to serve repeated requests.
 
         Args:
             url: YouTube video URL
@@ -590,6 +1127,15 @@ class YouTubeTranscriptFetcher:
                 video_id = url
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
 
+            cached = _VIDEO_INFO_CACHE.get(video_id)
+            if cached is None:
+                cached = _disk_cache_get('video_info', video_id, _VIDEO_INFO_TTL)
+                if cached is not None:
+                    cached["upload_date"] = datetime.fromisoformat(cached["upload_date"])
+                    _VIDEO_INFO_CACHE.set(video_id, cached)
+            if cached is not None:
+                return dict(cached)
+
             # Extract info using yt-dlp
             info = self.ydl.extract_info(video_url, download=False)
 
@@ -611,7 +1157,9 @@ class YouTubeTranscriptFetcher:
                 "success": True
             }
 
-            return video_info
+            _VIDEO_INFO_CACHE.set(video_id, video_info)
+            _disk_cache_put('video_info', video_id, {**video_info, "upload_date": upload_date.isoformat()})
+            return dict(video_info)
         except Exception as e:
             logger.error(f"Error getting video info: {e}")
             return {
@@ -625,6 +1173,37 @@ class YouTubeTranscriptFetcher:
                 "error": str(e)
             }
 
+    def get_transcripts(
+        self,
+        urls: List[str],
+        language: str = "en",
+        with_timestamps: bool = False,
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Get the transcripts for several YouTube videos concurrently.
+
+        Fetches run on a thread pool and share this fetcher's connection pool;
+        requests are still throttled to YOUTUBE_REQUESTS_PER_SECOND overall.
+
+        Args:
+            urls: YouTube video URLs or IDs
+            language: Preferred language code (defaults to English)
+            with_timestamps: Whether to include timestamps in the output
+            max_workers: Maximum number of videos fetched at once
+
+        Returns:
+            One get_transcript result per input URL, in input order; an invalid URL
+            yields a failed result instead of raising
+        """
+        def fetch(url: str) -> Dict[str, Any]:
+            try:
+                return self.get_transcript(url, language, with_timestamps)
+            except ValueError as e:
+                return {"title": None, "transcript": "", "language": None, "success": False, "error": str(e), "video_id": "unknown"}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            return list(executor.map(fetch, urls))
+
 # Convenience function for simple usage
 # ===== PUBLIC API FUNCTIONS ===== #
 
@@ -637,7 +1216,8 @@ def get_youtube_transcript(
     http_proxy: Optional[str] = None,
     https_proxy: Optional[str] = None,
     response_limit: int = -1,
-    next_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None,
+    include_title: bool = True
 ) -> Dict[str, Any]:
     """
     Convenience function to get a YouTube transcript without creating a fetcher instance.
@@ -652,6 +1232,7 @@ def get_youtube_transcript(
         https_proxy: Optional HTTPS proxy URL
         response_limit: Maximum number of characters for paginated responses (-1 for no pagination)
         next_cursor: Cursor for pagination
+        include_title: Look up the video title (see YouTubeTranscriptFetcher.get_transcript)
 
     Returns:
         Dictionary with transcript information
@@ -663,7 +1244,59 @@ def get_youtube_transcript(
         https_proxy=https_proxy,
         response_limit=response_limit
     )
-    return fetcher.get_transcript(url, language, with_timestamps, next_cursor=next_cursor)
+    return fetcher.get_transcript(url, language, with_timestamps, next_cursor=next_cursor, include_title=include_title)
+
+
+def invalidate_youtube_cache(video_id: str) -> None:
+    """Forget every cached transcript and the cached metadata for a video, in memory and on disk.
+
+    Args:
+        video_id: YouTube video ID
+    """
+    _TRANSCRIPT_CACHE.discard_where(lambda key: key[0] == video_id)
+    _VIDEO_INFO_CACHE.discard_where(lambda key: key == video_id)
+    _TITLE_CACHE.discard_where(lambda key: key[0] == video_id)
+    _DISK_CACHE.delete(_disk_key('video_info', video_id))
+    _DISK_CACHE.delete(('transcript', video_id), prefix=True)
+    _DISK_CACHE.delete(('no_subtitles', video_id), prefix=True)
+
+
+def get_youtube_transcripts(
+    urls: List[str],
+    language: str = "en",
+    with_timestamps: bool = False,
+    webshare_username: Optional[str] = None,
+    webshare_password: Optional[str] = None,
+    http_proxy: Optional[str] = None,
+    https_proxy: Optional[str] = None,
+    response_limit: int = -1,
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to get several YouTube transcripts concurrently.
+
+    Args:
+        urls: YouTube video URLs or IDs
+        language: Preferred language code
+        with_timestamps: Whether to include timestamps
+        webshare_username: Optional Webshare proxy username
+        webshare_password: Optional Webshare proxy password
+        http_proxy: Optional HTTP proxy URL
+        https_proxy: Optional HTTPS proxy URL
+        response_limit: Maximum number of characters per transcript (-1 for no pagination)
+        max_workers: Maximum number of videos fetched at once
+
+    Returns:
+        One transcript dictionary per input URL, in input order
+    """
+    fetcher = YouTubeTranscriptFetcher(
+        webshare_username=webshare_username,
+        webshare_password=webshare_password,
+        http_proxy=http_proxy,
+        https_proxy=https_proxy,
+        response_limit=response_limit
+    )
+    return fetcher.get_transcripts(urls, language, with_timestamps, max_workers)
 
 
 # Get video info convenience function
@@ -696,12 +1329,114 @@ def get_youtube_video_info(
     return fetcher.get_video_info(url)
 
 
+def _ytdlp_failure(video_id: str, error: str, title: str = "Unknown Title") -> Dict[str, Any]:
+    """Return the result dictionary for a failed yt-dlp transcript lookup."""
+    return {
+        "title": title,
+        "transcript": "",
+        "language": None,
+        "success": False,
+        "error": error,
+        "video_id": video_id
+    }
+
+
+def _ytdlp_shortcut(
+    session: requests.Session,
+    video_id: str,
+    languages: List[str],
+    cache_key: Tuple,
+    missing_key: Tuple
+) -> Optional[Dict[str, Any]]:
+    """Return a video's yt-dlp transcript result without running yt-dlp, or None if that needs yt-dlp."""
+    # Repeat calls for a video are served from the transcript caches (memory, then disk)
+    cached = _TRANSCRIPT_CACHE.get(cache_key)
+    if cached is None:
+        cached = _disk_cache_get('transcript', cache_key, _TRANSCRIPT_TTL)
+        if cached is not None:
+            _TRANSCRIPT_CACHE.set(cache_key, cached)
+    if cached is not None:
+        logger.info("Using cached yt-dlp transcript for %s", video_id)
+        return dict(cached)
+
+    # Most videos without captions are asked for again soon; answer those without another extraction
+    missing = _disk_cache_get('no_subtitles', missing_key, _NO_SUBTITLES_TTL)
+    if missing is not None:
+        logger.info("No subtitles for %s (cached)", video_id)
+        return dict(missing)
+
+    # A plain language code can often be fetched in one request, without starting yt-dlp at all
+    if _PLAIN_LANGUAGE_RE.fullmatch(languages[0]):
+        lines = _timedtext_lines(session, video_id, languages[0])
+        if lines:
+            result = {
+                "title": get_video_title(session, video_id, _title_languages(languages)),
+                "transcript": '\n'.join(lines),
+                "language": languages[0],
+                "success": True,
+                "video_id": video_id,
+                "method": "timedtext-direct"
+            }
+            _TRANSCRIPT_CACHE.set(cache_key, result)
+            _disk_cache_put('transcript', cache_key, result)
+            return dict(result)
+    return None
+
+
+def _ytdlp_result(
+    video_dir: str,
+    video_id: str,
+    languages: List[str],
+    title: str,
+    cache_key: Tuple,
+    missing_key: Tuple,
+    captions_listed: bool
+) -> Dict[str, Any]:
+    """Build (and cache) a video's transcript result from the subtitle files yt-dlp wrote to video_dir.
+
+    captions_listed tells whether the extracted info listed any subtitle or automatic
+    caption tracks; only a video that lists none is remembered as having no subtitles,
+    since tracks that are listed but not written (a missing PO token, say) may download
+    on the next attempt.
+    """
+    # Check for subtitle files (full paths, json3 first)
+    subtitle_files = _subtitle_files(video_dir)
+
+    if not subtitle_files:
+        logger.warning("No subtitle files found with yt-dlp")
+        if captions_listed:
+            return _ytdlp_failure(video_id, "Subtitle tracks are listed but none could be downloaded", title)
+        result = _ytdlp_failure(video_id, "No subtitle files found", title)
+        _disk_cache_put('no_subtitles', missing_key, result)
+        return dict(result)
+
+    # Use the most preferred language found, in json3 where available, which needs no text filtering
+    sub_file_path, subtitle_language = _preferred_subtitle(subtitle_files, languages)
+    if sub_file_path.endswith('.json3'):
+        transcript_text = '\n'.join(_json3_lines(sub_file_path))
+    else:
+        transcript_text = '\n'.join(_vtt_lines(sub_file_path))
+
+    result = {
+        "title": title,
+        "transcript": transcript_text,
+        "language": subtitle_language,
+        "success": True,
+        "video_id": video_id,
+        "method": "yt-dlp-direct"
+    }
+    _TRANSCRIPT_CACHE.set(cache_key, result)
+    _disk_cache_put('transcript', cache_key, result)
+    return dict(result)
+
+
 # Direct yt-dlp function for transcript extraction
 def get_transcript_via_ytdlp(
     url: str,
     timeout: int = 60,
     response_limit: int = -1,
-    next_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None,
+    languages: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Get a YouTube transcript using only yt-dlp.
@@ -712,128 +1447,124 @@ def get_transcript_via_ytdlp(
         timeout: Maximum time to wait for subtitle download
         response_limit: Maximum number of characters for paginated responses (-1 for no pagination)
         next_cursor: Cursor for pagination
+        languages: Subtitle languages in order of preference, as yt-dlp regexes
+            (e.g. ["en.*", "de"]); all are requested in a single yt-dlp run (default ["en"])
 
     Returns:
         Dictionary with transcript information
     """
-    try:
+    return get_transcripts_via_ytdlp([url], timeout, languages)[0]
+
+
+def get_transcripts_via_ytdlp(
+    urls: List[str],
+    timeout: int = 60,
+    languages: Optional[List[str]] = None,
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Get several YouTube transcripts using only yt-dlp, through pooled yt-dlp instances.
+
+    Videos already cached or served by the timedtext endpoint never reach yt-dlp;
+    the rest are downloaded back to back while their titles are fetched, and the
+    subtitle files are parsed concurrently afterwards.
+
+    Args:
+        urls: YouTube video URLs or IDs
+        timeout: Maximum time to wait for subtitle download
+        languages: Subtitle languages in order of preference, as yt-dlp regexes
+            (e.g. ["en.*", "de"]); all are requested in a single yt-dlp run (default ["en"])
+        max_workers: Maximum number of titles fetched or subtitle files parsed at once
+
+    Returns:
+        One transcript dictionary per input URL, in input order
+    """
+    languages = languages or ["en"]
+    # Get the video titles over the shared connection pool used by the fetchers
+    session = _http_clients(None, None, None, None, _YOUTUBE_PROXY_POOL)[0]
+    # "No subtitles" results are remembered per POT provider, so they are looked up again
+    # once a provider appears or changes
+    bgutil_url = get_bgutil_provider_url()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+    pending = []
+    for index, url in enumerate(urls):
         # Try to extract video ID from URL
         try:
             video_id = extract_video_id(url)
         except ValueError:
             if not url.isalnum() or len(url) != 11:
-                raise ValueError(f"Invalid YouTube video URL or ID: {url}")
+                logger.error("Error using yt-dlp for transcript: Invalid YouTube video URL or ID: %s", url)
+                results[index] = _ytdlp_failure("unknown", f"Invalid YouTube video URL or ID: {url}")
+                continue
             video_id = url
-            url = f"https://www.youtube.com/watch?v={video_id}"
-
-        # Create a temporary file for the subtitle
-        with tempfile.NamedTemporaryFile(suffix='.vtt', delete=False) as temp_file:
-            subtitle_path = temp_file.name
-
-        logger.info(f"Fetching transcript for {url} using yt-dlp...")
-
-        # bgutil plugins are automatically discovered by yt-dlp if installed
-
-        # Configure yt-dlp options
-        ydl_opts = {
-            'skip_download': True,
-            'writesubtitles': True,
-            'writeautomaticsub': True,
-            'subtitleslangs': ['en'],
-            'subtitlesformat': 'vtt',
-            'outtmpl': subtitle_path.replace('.vtt', ''),
-            'quiet': True,
-            'ignore_no_formats_error': True,
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            },
-            # Add extractor args to avoid SABR issues
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['android', 'ios']
-                },
-            },
-        }
 
-        # Configure bgutil POT provider parameters if available
-        if BGUTIL_POT_PROVIDER_URL:
-            logger.info(f"Using bgutil POT provider at {BGUTIL_POT_PROVIDER_URL}")
-            # Select provider and set base_url for plugin
-            ydl_opts['extractor_args']['youtube']['pot_provider'] = ['bgutil:http']
-            ydl_opts['extractor_args'].setdefault('youtubepot-bgutilhttp', {})['base_url'] = [BGUTIL_POT_PROVIDER_URL]
-            if POT_TRACE_ENABLED:
-                ydl_opts['extractor_args']['youtube']['pot_trace'] = ['true']
-
-        # Create a session to get the video title
-        session = requests.Session()
-        title = get_video_title(session, video_id, ["en"])
-
-        # Run yt-dlp to download subtitles
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-
-        # Check for subtitle files
-        base_path = subtitle_path.replace('.vtt', '')
-        subtitle_files = [f for f in os.listdir(os.path.dirname(base_path))
-                        if os.path.isfile(os.path.join(os.path.dirname(base_path), f))
-                        and f.startswith(os.path.basename(base_path))
-                        and (f.endswith('.vtt') or f.endswith('.srt'))]
-
-        if subtitle_files:
-            # Use the first subtitle file found
-            sub_file_path = os.path.join(os.path.dirname(base_path), subtitle_files[0])
-            with open(sub_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Process the VTT/SRT file to extract just the text
-            lines = []
-            for line in content.split('\n'):
-                # Skip timing lines and metadata
-                if '-->' in line or line.strip().isdigit() or line.startswith('WEBVTT') or not line.strip():
-                    continue
-                lines.append(line.strip())
+        cache_key = (video_id, ",".join(languages), False, "yt-dlp-direct")
+        missing_key = (*cache_key, bgutil_url)
+        results[index] = _ytdlp_shortcut(session, video_id, languages, cache_key, missing_key)
+        if results[index] is None:
+            pending.append((index, video_id, cache_key, missing_key))
 
-            transcript_text = '\n'.join(lines)
-            return {
-                "title": title,
-                "transcript": transcript_text,
-                "language": "auto",  # We don't know the exact language from yt-dlp
-                "success": True,
-                "video_id": video_id,
-                "method": "yt-dlp-direct"
+    if not pending:
+        return results
+
+    # yt-dlp writes the subtitles into a directory of their own, one subdirectory per
+    # video, so concurrent calls never see each other's files and one rmtree cleans it all up
+    try:
+        subtitle_dir = tempfile.mkdtemp(prefix='yt-subs-', dir=_SUBTITLE_TMP_DIR)
+    except OSError as e:
+        logger.error("Error using yt-dlp for transcript: %s", e)
+        for index, video_id, _, _ in pending:
+            results[index] = _ytdlp_failure(video_id, str(e))
+        return results
+    try:
+        # Fetch the titles, localized like the subtitles, while yt-dlp downloads the subtitles;
+        # the two touch disjoint state
+        title_languages = _title_languages(languages)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            title_futures = {
+                index: executor.submit(get_video_title, session, video_id, title_languages)
+                for index, video_id, _, _ in pending
             }
-        else:
-            logger.warning("No subtitle files found with yt-dlp")
-            return {
-                "title": title,
-                "transcript": "",
-                "language": None,
-                "success": False,
-                "error": "No subtitle files found",
-                "video_id": video_id
+
+            # Run yt-dlp to download subtitles into each video's directory. Instances are
+            # pooled, so PO tokens and player data fetched for earlier videos and calls are
+            # reused; every wanted language comes from one extraction per video, and
+            # YouTube's native timed-text JSON is preferred, with VTT as a fallback
+            # Every failure is kept per video, so one bad video (or a yt-dlp that cannot be
+            # imported or built) turns into failure results instead of failing the batch
+            errors = {}
+            captions_listed = {}
+            for index, video_id, _, _ in pending:
+                logger.info("Fetching transcript for %s using yt-dlp...", video_id)
+                try:
+                    video_dir = os.path.join(subtitle_dir, video_id)
+                    os.makedirs(video_dir, exist_ok=True)
+                    # Checked out per video, so other downloads are never held up for a whole batch
+                    with _subtitle_ydl(tuple(languages), 'json3/vtt/best') as ydl:
+                        ydl.params['paths'] = {'home': video_dir}
+                        info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=True)
+                    captions_listed[index] = bool(info and (info.get('subtitles') or info.get('automatic_captions')))
+                except Exception as e:
+                    errors[index] = e
+
+            parse_futures = {
+                index: executor.submit(
+                    _ytdlp_result, os.path.join(subtitle_dir, video_id), video_id, languages,
+                    title_futures[index].result(), cache_key, missing_key, captions_listed[index]
+                )
+                for index, video_id, cache_key, missing_key in pending if index not in errors
             }
-    except Exception as e:
-        logger.error(f"Error using yt-dlp for transcript: {e}")
-        return {
-            "title": "Unknown Title",
-            "transcript": "",
-            "language": None,
-            "success": False,
-            "error": str(e),
-            "video_id": video_id if 'video_id' in locals() else "unknown"
-        }
+            for index, video_id, _, _ in pending:
+                if index in parse_futures:
+                    try:
+                        results[index] = parse_futures[index].result()
+                        continue
+                    except Exception as e:
+                        errors[index] = e
+                logger.error("Error using yt-dlp for transcript: %s", errors[index])
+                results[index] = _ytdlp_failure(video_id, str(errors[index]))
     finally:
-        # Clean up temporary files
-        try:
-            if os.path.exists(subtitle_path):
-                os.remove(subtitle_path)
-            # Also try to remove any other subtitle files that might have been created
-            if 'base_path' in locals():
-                for file in os.listdir(os.path.dirname(base_path)):
-                    if file.startswith(os.path.basename(base_path)) and (file.endswith('.vtt') or file.endswith('.srt')):
-                        try:
-                            os.remove(os.path.join(os.path.dirname(base_path), file))
-                        except:
-                            pass
-        except:
-            pass
+        # Clean up the subtitle directory and everything yt-dlp put in it
+        shutil.rmtree(subtitle_dir, ignore_errors=True)
+    return results